@@ -0,0 +1,380 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Template Generator Benchmarks
+Builds synthetic template corpora and measures the HTML and PDF generators
+
+Usage:
+    python benchmarks/bench_templates.py                 # full run, compare with (or record) the baseline
+    python benchmarks/bench_templates.py --quick         # 10x smaller corpora
+    python benchmarks/bench_templates.py --save-baseline # store results as the new baseline
+    python benchmarks/bench_templates.py --paths startup # only CLI cold starts
+
+Each scenario runs in a fresh process so peak RSS is measured per path and
+corpus. Results are written as JSON and compared against the stored baseline;
+the exit status is 1 when a metric regresses beyond the tolerance. Timings
+only compare on the same machine, so the baseline is not committed: the
+first run without one records it.
+
+The startup path times void_templates.py commands in fresh interpreters and
+fails outright when one of them imports Markdown or WeasyPrint.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import platform
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = Path(__file__).resolve().parent
+DEFAULT_OUTPUT = BENCH_DIR / "latest.json"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# name: (document count, approximate document size in bytes)
+CORPORA = {
+    'single-4mb': (1, 4 * 1024 * 1024),
+    'hundred-64kb': (100, 64 * 1024),
+    'ten-thousand-2kb': (10000, 2 * 1024),
+}
+
+# PDF layout is orders of magnitude slower; only this many documents of each
+# corpus are rendered and throughput is reported for that sample
+DEFAULT_PDF_SAMPLE = 20
+
+DEFAULT_TOLERANCE = 0.15
+
+# CLI commands timed from a fresh interpreter: name -> arguments to python.
+# None of them converts anything, so none may import the heavy modules.
+STARTUP_COMMANDS = {
+    'python -c pass': ['-c', 'pass'],
+    'void_templates --help': ['void_templates.py', '--help'],
+    'void_templates html --help': ['void_templates.py', 'html', '--help'],
+    'void_templates pdf --help': ['void_templates.py', 'pdf', '--help'],
+    'void_templates check': ['void_templates.py', 'check', '--html-only'],
+}
+HEAVY_MODULES = frozenset(['markdown', 'weasyprint'])
+DEFAULT_STARTUP_RUNS = 10
+
+# Startup regressions smaller than this are timer and scheduler noise
+STARTUP_NOISE_MS = 5
+
+_WORDS = ("crawl index serp query cluster intent canonical sitemap schema snippet "
+          "coverage backlink anchor locale template workflow signal metric pattern").split()
+
+def _sentence(rng, words=12):
+    """Return a random sentence of SEO-flavoured words"""
+    text = ' '.join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + '.'
+
+def _section(rng, index):
+    """Return one synthetic template section mixing every construct the generators style"""
+    kind = index % 4
+    lines = [f"## {index}) {_sentence(rng, 3)[:-1]}", ""]
+    if kind == 0:
+        lines += ["- **Project/Module name:** ", "- **Author / Team:** ", "- **Date:** ", "- **Owner:** ", ""]
+        lines += ["What makes this worth solving? Impact on biz/users/process?", ""]
+    elif kind == 1:
+        lines += [f"- [ ] {_sentence(rng, 6)}  " for _ in range(8)] + [""]
+    elif kind == 2:
+        lines += ["```python"] + [f"def step_{index}_{n}(rows):\n    return [r for r in rows if r['{rng.choice(_WORDS)}']]"
+                                  for n in range(4)] + ["```", ""]
+    else:
+        lines += [_sentence(rng, 40), "", f"**Pitfall to avoid:** {_sentence(rng, 8)}", "",
+                  "| Metric | Target |", "|---|---|", f"| {rng.choice(_WORDS)} | {rng.randint(1, 99)}% |", ""]
+    return '\n'.join(lines) + '\n'
+
+def build_document(rng, index, size):
+    """Return a synthetic VOID template of roughly size bytes"""
+    parts = [f"---\ntitle: Synthetic {index}\ndescription: \"Benchmark document {index}\"\norder: {index}\n---\n",
+             f"# VOID Loop — Synthetic {index}\n\n> Purpose: {_sentence(rng)}\n\n"]
+    total = sum(len(part) for part in parts)
+    section = 0
+    while total < size:
+        part = _section(rng, section)
+        parts.append(part)
+        total += len(part)
+        section += 1
+    return ''.join(parts)
+
+def build_corpus(corpus_dir, count, size, seed=0):
+    """Write count synthetic templates into corpus_dir and return their paths"""
+    rng = random.Random(seed)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for index in range(count):
+        path = corpus_dir / f"VOID_Synthetic_{index:05d}.md"
+        path.write_text(build_document(rng, index, size), encoding='utf-8')
+        paths.append(path)
+    return paths
+
+def _peak_rss_kib():
+    """Return this process's peak resident set size in KiB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+def _summarize(samples):
+    """Return latency statistics in milliseconds for a list of seconds"""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    return {
+        'mean_ms': statistics.fmean(ordered) * 1000,
+        'p50_ms': ordered[len(ordered) // 2] * 1000,
+        'p95_ms': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000,
+        'total_s': sum(ordered),
+    }
+
+def _bench_html(paths, out_dir):
+    """Time each HTML stage, then generate_html_template end to end"""
+    import create_html_templates as generator
+    from template_index import parse_front_matter, split_front_matter
+    from template_markdown import convert_markdown
+
+    stages = {'read': [], 'convert': [], 'wrap': [], 'write': []}
+    for path in paths:
+        started = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            front_matter, md_content = split_front_matter(f.read())
+        read_done = time.perf_counter()
+        body = convert_markdown(md_content)
+        convert_done = time.perf_counter()
+        name, description = generator.get_template_info(path, parse_front_matter(front_matter))
+        page = generator.wrap_html_document(body, name, description)
+        wrap_done = time.perf_counter()
+        with open(out_dir / f"{path.stem}.html", 'w', encoding='utf-8') as f:
+            f.write(page)
+        write_done = time.perf_counter()
+        stages['read'].append(read_done - started)
+        stages['convert'].append(convert_done - read_done)
+        stages['wrap'].append(wrap_done - convert_done)
+        stages['write'].append(write_done - wrap_done)
+
+    end_to_end = []
+    for path in paths:
+        started = time.perf_counter()
+        generator.generate_html_template(path, out_dir)
+        end_to_end.append(time.perf_counter() - started)
+    return stages, end_to_end
+
+def _bench_pdf(paths, out_dir):
+    """Time each PDF stage, then generate_pdf end to end"""
+    import generate_pdf_templates as generator
+    from weasyprint import HTML
+    from template_index import parse_front_matter, split_front_matter, template_source
+
+    context = generator.get_render_context()
+    stages = {'read': [], 'convert': [], 'layout': [], 'write': []}
+    for path in paths:
+        started = time.perf_counter()
+        with open(path, 'r', encoding='utf-8') as f:
+            front_matter, md_content = split_front_matter(f.read())
+        read_done = time.perf_counter()
+        name = template_source(path, parse_front_matter(front_matter)).name
+        document_html = generator.markdown_to_html(md_content, name)
+        convert_done = time.perf_counter()
+        document = HTML(string=document_html, base_url=str(path.parent),
+                        url_fetcher=context.url_fetcher).render(
+            stylesheets=[context.stylesheet], font_config=context.font_config, cache=context.image_cache)
+        layout_done = time.perf_counter()
+        document.write_pdf(out_dir / f"{path.stem}.pdf")
+        write_done = time.perf_counter()
+        stages['read'].append(read_done - started)
+        stages['convert'].append(convert_done - read_done)
+        stages['layout'].append(layout_done - convert_done)
+        stages['write'].append(write_done - layout_done)
+
+    end_to_end = []
+    for path in paths:
+        started = time.perf_counter()
+        generator.generate_pdf(path, out_dir)
+        end_to_end.append(time.perf_counter() - started)
+    return stages, end_to_end
+
+def run_scenario(kind, paths, out_dir):
+    """Benchmark one generator path over paths; runs inside a fresh process"""
+    sys.path.insert(0, str(REPO_DIR))
+    bench = _bench_html if kind == 'html' else _bench_pdf
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # Keep the generators' per-file progress lines out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            rss_before = _peak_rss_kib()
+            stages, end_to_end = bench(paths, out_dir)
+    except (ImportError, OSError) as e:
+        return {'skipped': f"{type(e).__name__}: {e}"}
+
+    total_bytes = sum(path.stat().st_size for path in paths)
+    elapsed = sum(end_to_end)
+    return {
+        'documents': len(paths),
+        'input_bytes': total_bytes,
+        'docs_per_s': len(paths) / elapsed if elapsed else None,
+        'mb_per_s': total_bytes / (1024 * 1024) / elapsed if elapsed else None,
+        'end_to_end': _summarize(end_to_end),
+        'stages': {name: _summarize(samples) for name, samples in stages.items()},
+        'peak_rss_kib': _peak_rss_kib(),
+        'rss_after_import_kib': rss_before,
+    }
+
+def bench_startup(runs):
+    """Time each startup command and list the heavy modules it imports"""
+    results = {}
+    for name, args in STARTUP_COMMANDS.items():
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            subprocess.run([sys.executable, *args], cwd=REPO_DIR,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            samples.append(time.perf_counter() - started)
+
+        # -X importtime lists every module the command loads, one per stderr line
+        trace = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=REPO_DIR,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True).stderr
+        imported = {line.rsplit('|', 1)[-1].strip() for line in trace.splitlines()
+                    if line.startswith('import time:')}
+        results[name] = {**_summarize(samples), 'heavy_imports': sorted(HEAVY_MODULES & imported)}
+    return results
+
+def run_isolated(kind, paths, out_dir):
+    """Run a scenario in a spawned process so its peak RSS is its own"""
+    with multiprocessing.get_context('spawn').Pool(1) as pool:
+        return pool.apply(run_scenario, (kind, paths, out_dir))
+
+def compare(results, baseline, tolerance):
+    """Return human-readable regressions of results against baseline"""
+    regressions = []
+    for name, scenario in results['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous or 'skipped' in scenario or 'skipped' in previous:
+            continue
+        if previous['docs_per_s'] and scenario['docs_per_s'] < previous['docs_per_s'] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {scenario['docs_per_s']:.1f} docs/s "
+                               f"vs {previous['docs_per_s']:.1f} baseline")
+        if scenario['peak_rss_kib'] > previous['peak_rss_kib'] * (1 + tolerance):
+            regressions.append(f"{name}: peak RSS {scenario['peak_rss_kib'] / 1024:.1f} MiB "
+                               f"vs {previous['peak_rss_kib'] / 1024:.1f} baseline")
+        for stage, stats in scenario['stages'].items():
+            before = previous['stages'].get(stage, {}).get('p50_ms')
+            # Ignore sub-millisecond stages, where timer noise dominates
+            if before and before > 1 and stats['p50_ms'] > before * (1 + tolerance):
+                regressions.append(f"{name}: {stage} p50 {stats['p50_ms']:.2f} ms vs {before:.2f} baseline")
+
+    for name, command in results.get('startup', {}).items():
+        if command['heavy_imports']:
+            regressions.append(f"{name}: imports {', '.join(command['heavy_imports'])}")
+        before = baseline.get('startup', {}).get(name, {}).get('p50_ms')
+        if before and command['p50_ms'] > max(before * (1 + tolerance), before + STARTUP_NOISE_MS):
+            regressions.append(f"{name}: cold start p50 {command['p50_ms']:.1f} ms vs {before:.1f} baseline")
+    return regressions
+
+def print_table(results):
+    """Print a one-line summary per scenario"""
+    if results['scenarios']:
+        print(f"{'scenario':<30} {'docs/s':>10} {'MB/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'peak MiB':>9}")
+    for name, scenario in results['scenarios'].items():
+        if 'skipped' in scenario:
+            print(f"{name:<30} skipped ({scenario['skipped'][:60]})")
+            continue
+        e2e = scenario['end_to_end']
+        print(f"{name:<30} {scenario['docs_per_s']:>10.1f} {scenario['mb_per_s']:>8.2f} "
+              f"{e2e['p50_ms']:>9.2f} {e2e['p95_ms']:>9.2f} {scenario['peak_rss_kib'] / 1024:>9.1f}")
+    if results.get('startup'):
+        if results['scenarios']:
+            print()
+        print(f"{'cold start':<30} {'p50 ms':>9} {'p95 ms':>9}  heavy imports")
+        for name, command in results['startup'].items():
+            print(f"{name:<30} {command['p50_ms']:>9.1f} {command['p95_ms']:>9.1f}  "
+                  f"{', '.join(command['heavy_imports']) or '-'}")
+
+def main(argv=None):
+    """Main function to run the benchmark suite"""
+
+    parser = argparse.ArgumentParser(description="Benchmark the VoidSEO template generators")
+    parser.add_argument('--quick', action='store_true', help="use corpora 10x smaller")
+    parser.add_argument('--corpus', action='append', choices=sorted(CORPORA),
+                        help="only run the named corpus (repeatable)")
+    parser.add_argument('--paths', default='html,pdf,startup',
+                        help="comma-separated generator paths (html,pdf,startup)")
+    parser.add_argument('--pdf-sample', type=int, default=DEFAULT_PDF_SAMPLE, metavar='N',
+                        help="render at most N documents per corpus on the PDF path")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT, help="where to write JSON results")
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE, help="baseline JSON to compare with")
+    parser.add_argument('--save-baseline', action='store_true', help="write results to the baseline file")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="allowed relative regression before failing (default 0.15)")
+    parser.add_argument('--startup-runs', type=int, default=DEFAULT_STARTUP_RUNS, metavar='N',
+                        help="time each CLI cold start N times on the startup path")
+    args = parser.parse_args(argv)
+
+    kinds = [kind.strip() for kind in args.paths.split(',') if kind.strip()]
+    corpus_kinds = [kind for kind in kinds if kind != 'startup']
+    results = {
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'quick': args.quick,
+        'scenarios': {},
+    }
+
+    work_dir = Path(tempfile.mkdtemp(prefix='voidseo-bench-'))
+    try:
+        for corpus_name in (args.corpus or CORPORA) if corpus_kinds else ():
+            count, size = CORPORA[corpus_name]
+            if args.quick:
+                count = max(1, count // 10)
+                size = max(1024, size // 10)
+            print(f"📚 Building corpus {corpus_name}: {count} x ~{size // 1024} KiB")
+            paths = build_corpus(work_dir / corpus_name, count, size)
+
+            for kind in corpus_kinds:
+                sample = paths[:args.pdf_sample] if kind == 'pdf' else paths
+                name = f"{kind}/{corpus_name}"
+                print(f"⏱️  Running {name} ({len(sample)} documents)")
+                results['scenarios'][name] = run_isolated(kind, sample, work_dir / f"out-{kind}-{corpus_name}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if 'startup' in kinds:
+        print(f"⏱️  Timing CLI cold starts ({args.startup_runs} runs each)")
+        results['startup'] = bench_startup(args.startup_runs)
+
+    print("=" * 80)
+    print_table(results)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, indent=2), encoding='utf-8')
+    print(f"📄 Results written to {args.output}")
+
+    if args.save_baseline or not args.baseline.exists():
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(results, indent=2), encoding='utf-8')
+        if args.save_baseline:
+            print(f"📌 Baseline saved to {args.baseline}")
+        else:
+            print(f"📌 No baseline yet; saved these results to {args.baseline} for later runs to compare with")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding='utf-8'))
+    if baseline.get('quick') != args.quick:
+        print("⚠️  Baseline was recorded with a different --quick setting; skipping comparison")
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"❌ Regression: {regression}")
+    if not regressions:
+        print("✅ No regressions against baseline")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+VoidSEO Build Manifest
+Tracks content hashes of template sources, styles and generator code so
+unchanged outputs can be skipped on the next run
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+MANIFEST_NAME = ".build-manifest.json"
+MANIFEST_VERSION = 1
+
+def text_digest(text):
+    """Return the SHA-256 hex digest of a string"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+def file_digest(path):
+    """Return the SHA-256 hex digest of a file's bytes"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def code_digest(*paths):
+    """Return one digest covering the source of every given module file"""
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).name.encode('utf-8'))
+        digest.update(file_digest(path).encode('ascii'))
+    return digest.hexdigest()
+
+class BuildManifest:
+    """Persistent record of the fingerprint each output was last built from"""
+
+    def __init__(self, output_dir, name=MANIFEST_NAME):
+        self.path = Path(output_dir) / name
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load entries from disk, starting empty if missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == MANIFEST_VERSION:
+            self.entries = data.get('entries', {})
+
+    def is_fresh(self, output_path, fingerprint):
+        """Check whether output_path exists and was built from fingerprint"""
+        output_path = Path(output_path)
+        return output_path.exists() and self.entries.get(output_path.name) == fingerprint
+
+    def fingerprint(self, output_path):
+        """Return the fingerprint output_path was last built from, or None"""
+        return self.entries.get(Path(output_path).name)
+
+    def record(self, output_path, fingerprint):
+        """Remember the fingerprint output_path was just built from"""
+        name = Path(output_path).name
+        if self.entries.get(name) != fingerprint:
+            self.entries[name] = fingerprint
+            self.dirty = True
+
+    def forget(self, output_path):
+        """Drop output_path so it is rebuilt next time"""
+        if self.entries.pop(Path(output_path).name, None) is not None:
+            self.dirty = True
+
+    def save(self):
+        """Atomically write the manifest if anything changed"""
+        if not self.dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': MANIFEST_VERSION, 'entries': self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
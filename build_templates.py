@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Unified Template Build
+Converts each markdown template once and emits both the HTML page and the PDF
+"""
+
+import argparse
+import functools
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from pathlib import Path
+
+import build_manifest
+import build_trace
+import template_archive
+import template_compress
+import template_index
+import template_minify
+import template_sitemap
+import create_html_templates as html_templates
+import generate_pdf_templates as pdf_templates
+
+# Generator modules, in dependency order, reloaded when edited in watch mode.
+# Markdown and WeasyPrint are only imported once something needs converting.
+GENERATOR_MODULES = ('build_manifest', 'build_trace', 'template_archive', 'template_compress', 'template_index',
+                     'template_markdown', 'template_minify', 'template_sitemap', 'create_html_templates',
+                     'generate_pdf_templates', 'worker_pool')
+
+WATCH_INTERVAL = 0.25
+WATCH_DEBOUNCE = 0.3
+
+def convert_template(md_file_path):
+    """Read and convert a template once, returning its converted body"""
+    from template_markdown import convert_markdown
+    
+    file_stem = Path(md_file_path).stem
+    with build_trace.stage('read', file_stem):
+        with open(md_file_path, 'r', encoding='utf-8') as f:
+            md_content = template_index.strip_front_matter(f.read())
+    
+    with build_trace.stage('convert', file_stem):
+        return convert_markdown(md_content)
+
+def build_templates(sources, html_dir=None, pdf_dir=None, force=False, jobs=1, style=None, minify=False,
+                    limits=None, pool=None):
+    """Build the HTML and/or PDF output of each template from one shared conversion
+    
+    Pass None for html_dir or pdf_dir to skip that format, the
+    write_external_stylesheet() markup as style to link the shared stylesheet,
+    minify to strip whitespace from the HTML pages, and a make_pdf_pool() pool
+    to lay out the PDFs in its already running workers.
+    Returns the number of templates whose requested outputs are all up to date
+    afterwards.
+    """
+    
+    html_manifest = build_manifest.BuildManifest(html_dir) if html_dir else None
+    pdf_manifest = build_manifest.BuildManifest(pdf_dir) if pdf_dir else None
+    
+    success = {}
+    pdf_tasks = []
+    skipped_count = 0
+    
+    for source in sources:
+        file_path = source.path
+        if not file_path.exists():
+            print(f"⚠️  File not found: {file_path}")
+            continue
+        
+        # Work out which outputs are stale
+        source_hash = build_manifest.file_digest(file_path)
+        stale = []
+        if html_manifest:
+            html_path = html_dir / f"{file_path.stem}.html"
+            html_fingerprint = html_templates.output_fingerprint(source_hash, style, minify)
+            if force or not html_manifest.is_fresh(html_path, html_fingerprint):
+                stale.append('html')
+        if pdf_manifest:
+            pdf_path = pdf_dir / f"{file_path.stem}.pdf"
+            pdf_fingerprint = pdf_templates.output_fingerprint(source_hash)
+            if force or not pdf_manifest.is_fresh(pdf_path, pdf_fingerprint):
+                stale.append('pdf')
+        
+        if not stale:
+            print(f"⏭️  Up to date: {file_path}")
+            success[file_path] = True
+            skipped_count += 1
+            continue
+        
+        # Parse and transform once for every stale format
+        try:
+            body = convert_template(file_path)
+        except Exception as e:
+            print(f"❌ Error converting {file_path}: {e}")
+            success[file_path] = False
+            if 'html' in stale:
+                html_manifest.forget(html_path)
+            if 'pdf' in stale:
+                pdf_manifest.forget(pdf_path)
+            continue
+        
+        success[file_path] = True
+        if 'html' in stale:
+            with build_trace.stage('wrap', file_path.stem):
+                head_tags = html_templates.template_head_tags(file_path, source.metadata)
+                page = html_templates.wrap_html_document(body, source.name, source.description, style, head_tags)
+            if minify:
+                with build_trace.stage('minify', file_path.stem):
+                    page = template_minify.minify_html(page)
+            if html_templates.save_html(html_path, page):
+                html_manifest.record(html_path, html_fingerprint)
+            else:
+                html_manifest.forget(html_path)
+                success[file_path] = False
+        if 'pdf' in stale:
+            with build_trace.stage('wrap', file_path.stem):
+                document = pdf_templates.wrap_pdf_document(body, source.name)
+            base_url = str(file_path.resolve().parent)
+            pdf_tasks.append((file_path, pdf_path, pdf_fingerprint, (document, pdf_path, base_url)))
+    
+    # Lay out PDFs from the shared bodies, serially or across a process pool
+    limits = limits or pdf_templates.WorkerLimits()
+    if (pool is not None and pdf_tasks) or (jobs > 1 and len(pdf_tasks) > 1) or (
+            limits.max_tasks and len(pdf_tasks) > limits.max_tasks):
+        results = pdf_templates.run_pdf_pool(
+            pdf_templates._pdf_document_worker,
+            [(pdf_path, args) for _, pdf_path, _, args in pdf_tasks],
+            jobs, limits, pool)
+        results = (ok for _, ok in results)
+    else:
+        results = (pdf_templates.generate_pdf_document(*args) for _, _, _, args in pdf_tasks)
+    
+    for (file_path, pdf_path, pdf_fingerprint, _), ok in zip(pdf_tasks, results):
+        if ok:
+            pdf_manifest.record(pdf_path, pdf_fingerprint)
+        else:
+            pdf_manifest.forget(pdf_path)
+            success[file_path] = False
+    
+    for manifest in (html_manifest, pdf_manifest):
+        if manifest:
+            manifest.save()
+    
+    print("=" * 50)
+    print(f"✨ Built {sum(success.values())}/{len(sources)} templates ({skipped_count} up to date)")
+    return sum(success.values())
+
+def snapshot_mtimes(base_dir, modules):
+    """Return {path: (mtime_ns, size)} for every template source and generator module"""
+    
+    stamps = {}
+    for entry in template_index.iter_template_entries(base_dir):
+        stat = entry.stat()
+        stamps[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+    for path in modules:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        stamps[path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+def wait_for_changes(snapshot, last, interval=WATCH_INTERVAL, debounce=WATCH_DEBOUNCE):
+    """Poll snapshot() until it differs from last, then wait for saves to settle
+    
+    Returns the settled snapshot and the set of paths that changed.
+    """
+    
+    current = last
+    while current == last:
+        time.sleep(interval)
+        current = snapshot()
+    
+    # Debounce: keep waiting while editors are still writing
+    while True:
+        time.sleep(debounce)
+        settled = snapshot()
+        if settled == current:
+            break
+        current = settled
+    
+    changed = {path for path in set(last) | set(current) if last.get(path) != current.get(path)}
+    return current, changed
+
+def reload_generators():
+    """Reload edited generator code in place, dropping its warm state"""
+    for name in GENERATOR_MODULES:
+        # Modules not imported yet will load the new code when first used
+        if name in sys.modules:
+            importlib.reload(sys.modules[name])
+
+def build_archive(base_dir, sources, html_dir=None, force=False):
+    """Refresh the downloadable template ZIP from the sources and generated pages"""
+    members = template_archive.archive_members(sources, html_dir)
+    return template_archive.build_archive(base_dir / template_archive.ARCHIVE_NAME, members, force=force)
+
+def generated_pages(html_dir=None, pdf_dir=None):
+    """Return the generated HTML pages, stylesheets and indexes"""
+    paths = sorted([*html_dir.glob("*.html"), *html_dir.glob("*.css")]) if html_dir else []
+    if pdf_dir and (pdf_dir / "index.html").exists():
+        paths.append(pdf_dir / "index.html")
+    return paths
+
+def precompress_pages(html_dir=None, pdf_dir=None, force=False, jobs=None):
+    """Write .gz and .br siblings of the generated HTML pages and indexes"""
+    return template_compress.precompress(generated_pages(html_dir, pdf_dir), jobs=jobs, force=force)
+
+def remove_stale_compressed_pages(html_dir=None, pdf_dir=None):
+    """Delete .gz and .br siblings left from an earlier --precompress build of rewritten pages"""
+    return template_compress.remove_stale_compressed(generated_pages(html_dir, pdf_dir))
+
+def watch(base_dir, html_dir, pdf_dir, jobs=1, archive=True, precompress=False, external_css=False,
+          minify=False, sitemap=True, limits=None):
+    """Rebuild affected outputs whenever a template or generator module changes
+    
+    The Markdown converters, the WeasyPrint render context and, with jobs > 1,
+    the PDF worker pool stay warm between rebuilds; converters and render
+    context are only rebuilt after the generator code itself changes.
+    """
+    
+    modules = {Path(importlib.util.find_spec(name).origin).resolve() for name in GENERATOR_MODULES}
+    snapshot = functools.partial(snapshot_mtimes, base_dir, modules)
+    last = snapshot()
+    
+    print(f"👀 Watching {len(last) - len(modules)} templates and {len(modules)} generator modules (Ctrl+C to stop)")
+    
+    # One pool for the whole session; its workers are still recycled by task count and RSS
+    pool = pdf_templates.make_pdf_pool(jobs, limits) if jobs > 1 and pdf_dir else None
+    
+    try:
+        while True:
+            last, changed = wait_for_changes(snapshot, last)
+            started = time.perf_counter()
+            
+            # New templates are picked up here; the index only re-reads changed files
+            all_sources = template_index.discover_templates(base_dir)
+            if changed & modules:
+                print("🔁 Generator code changed, reloading...")
+                reload_generators()
+                if pool is not None:
+                    # Running workers still hold the old code
+                    pool.shutdown()
+                    pool = pdf_templates.make_pdf_pool(jobs, limits)
+                sources = all_sources
+            else:
+                sources = [source for source in all_sources if source.path in changed]
+            
+            # The stylesheet file is only rewritten when its hash changes
+            style = None
+            if external_css and html_dir:
+                style = html_templates.write_external_stylesheet(html_dir)
+            
+            # The manifest still skips outputs whose fingerprint is unchanged
+            build_templates(sources, html_dir, pdf_dir, jobs=jobs, style=style, minify=minify, limits=limits,
+                            pool=pool)
+            
+            # Added, renamed or retitled templates change the index cards
+            if html_dir:
+                html_templates.create_html_index(html_dir, style, minify=minify, sources=all_sources)
+            if pdf_dir:
+                pdf_templates.create_pdf_index(pdf_dir, minify=minify, sources=all_sources)
+            
+            if precompress:
+                precompress_pages(html_dir, pdf_dir)
+            else:
+                remove_stale_compressed_pages(html_dir, pdf_dir)
+            if sitemap and html_dir:
+                template_sitemap.update_template_sitemap(base_dir, all_sources, html_dir)
+            if archive:
+                build_archive(base_dir, all_sources, html_dir)
+            print(f"⏱️  Rebuilt in {(time.perf_counter() - started) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        print("\n👋 Stopped watching")
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+            pdf_templates.report_recycling(pool)
+
+def main(argv=None):
+    """Main function to build HTML and PDF templates in one pass"""
+    
+    parser = argparse.ArgumentParser(description="Build VoidSEO HTML and PDF templates in one pass")
+    parser.add_argument('--force', action='store_true', help="rebuild every template even if unchanged")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="lay out N PDFs in parallel (0 = one per CPU core)")
+    parser.add_argument('--watch', action='store_true',
+                        help="keep running and rebuild templates as their sources change")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write per-stage timings as Chrome trace JSON and print a summary")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="also record allocation peaks per stage (slower)")
+    parser.add_argument('--external-css', action='store_true',
+                        help="link a shared, content-hashed stylesheet instead of inlining it in every page")
+    parser.add_argument('--minify', action='store_true',
+                        help="strip whitespace and comments from the generated pages")
+    parser.add_argument('--precompress', action='store_true',
+                        help="also write .gz and .br copies of the generated pages")
+    parser.add_argument('--no-sitemap', dest='sitemap', action='store_false',
+                        help="do not merge the generated pages into sitemap.xml")
+    parser.add_argument('--audit', action='store_true',
+                        help="audit links and meta tags of the generated and static pages afterwards")
+    parser.add_argument('--no-zip', dest='archive', action='store_false',
+                        help=f"do not refresh {template_archive.ARCHIVE_NAME}")
+    pdf_templates.add_worker_limit_options(parser)
+    formats = parser.add_mutually_exclusive_group()
+    formats.add_argument('--html-only', action='store_true', help="only build the HTML pages")
+    formats.add_argument('--pdf-only', action='store_true', help="only build the PDFs")
+    args = parser.parse_args(argv)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    limits = pdf_templates.worker_limits(args)
+    
+    # Setup paths
+    base_dir = Path(__file__).parent
+    html_dir = None if args.pdf_only else base_dir / "templates" / "html"
+    pdf_dir = None if args.html_only else base_dir / "templates" / "pdf"
+    for output_dir in (html_dir, pdf_dir):
+        if output_dir:
+            output_dir.mkdir(parents=True, exist_ok=True)
+    
+    if args.trace:
+        build_trace.start(memory=args.trace_memory)
+    
+    print("🚀 Building VoidSEO Templates...")
+    print("=" * 50)
+    
+    style = None
+    if args.external_css and html_dir:
+        style = html_templates.write_external_stylesheet(html_dir)
+    
+    sources = template_index.discover_templates(base_dir)
+    build_templates(sources, html_dir, pdf_dir, force=args.force, jobs=jobs, style=style, minify=args.minify,
+                    limits=limits)
+    
+    # Create indexes
+    if html_dir:
+        html_templates.create_html_index(html_dir, style, minify=args.minify, sources=sources)
+    if pdf_dir:
+        pdf_templates.create_pdf_index(pdf_dir, minify=args.minify, sources=sources)
+    
+    if args.precompress:
+        with build_trace.stage('compress', 'precompress'):
+            precompress_pages(html_dir, pdf_dir, force=args.force)
+    else:
+        remove_stale_compressed_pages(html_dir, pdf_dir)
+    
+    if args.sitemap and html_dir:
+        template_sitemap.update_template_sitemap(base_dir, sources, html_dir)
+    
+    # Package the sources and generated pages for download
+    if args.archive:
+        with build_trace.stage('archive', template_archive.ARCHIVE_NAME):
+            build_archive(base_dir, sources, html_dir, force=args.force)
+    
+    if args.audit:
+        import seo_audit
+        print("=" * 50)
+        seo_audit.print_summary(seo_audit.audit_site(base_dir))
+    
+    if args.trace:
+        build_trace.finish(args.trace)
+    
+    if args.watch:
+        watch(base_dir, html_dir, pdf_dir, jobs=jobs, archive=args.archive, precompress=args.precompress,
+              external_css=args.external_css, minify=args.minify, sitemap=args.sitemap, limits=limits)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+VoidSEO Build Trace
+Optional per-stage timing and memory instrumentation for the template generators
+
+Stages are recorded as Chrome trace events (load the JSON in chrome://tracing
+or https://ui.perfetto.dev) and summarised per template at the end of a run.
+"""
+
+import contextlib
+import json
+import os
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict
+
+# Stage order used by the summary table
+STAGES = ('read', 'convert', 'postprocess', 'wrap', 'minify', 'layout', 'write', 'stream', 'compress',
+          'archive')
+
+_active = None
+
+def _current_rss_kib():
+    """Return the current resident set size in KiB, or the peak where unavailable"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') // 1024
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak // 1024 if sys.platform == 'darwin' else peak
+
+class BuildTrace:
+    """Collects stage events for one run"""
+
+    def __init__(self, memory=False):
+        self.memory = memory
+        self.events = []
+        self._local = threading.local()
+        if memory:
+            # Only imported when memory tracing is asked for; it is slow to load
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name, template=None):
+        """Time a stage; allocation peaks are measured for outermost stages only
+        
+        Nested stages without a template inherit the enclosing stage's template.
+        """
+        labels = self._local.__dict__.setdefault('labels', [])
+        template = template or (labels[-1] if labels else '?')
+        measure = self.memory and not labels
+        if measure:
+            import tracemalloc
+            tracemalloc.reset_peak()
+            allocated_before = tracemalloc.get_traced_memory()[0]
+        labels.append(template)
+        # Wall-clock start so events from worker processes line up
+        timestamp = time.time_ns()
+        started = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter_ns() - started
+            labels.pop()
+            args = {}
+            if measure:
+                args['alloc_peak_kib'] = (tracemalloc.get_traced_memory()[1] - allocated_before) // 1024
+            self.record(name, template, timestamp, duration, **args)
+
+    def record(self, name, template, timestamp, duration, tid=None, **args):
+        """Add a stage the caller timed itself (wall-clock start and duration in ns)
+        
+        For stages that interleave on one thread, such as coroutines, where
+        stage()'s label stack and allocation peaks would mix them up.
+        """
+        self.events.append({
+            'name': name,
+            'cat': 'stage',
+            'ph': 'X',
+            'ts': timestamp / 1000,
+            'dur': duration / 1000,
+            'pid': os.getpid(),
+            'tid': tid or threading.get_ident(),
+            'args': {'template': template, 'rss_kib': _current_rss_kib(), **args},
+        })
+
+    def drain(self):
+        """Remove and return the events recorded so far"""
+        events, self.events = self.events, []
+        return events
+
+    def merge(self, events):
+        """Add events recorded by another process"""
+        self.events.extend(events)
+
+    def write_chrome_trace(self, path):
+        """Write the events as Chrome trace-event JSON"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+
+    def print_summary(self):
+        """Print per-template stage durations (ms) and peak allocations"""
+        durations = defaultdict(lambda: defaultdict(float))
+        peaks = defaultdict(int)
+        for event in self.events:
+            template = event['args']['template']
+            durations[template][event['name']] += event['dur'] / 1000
+            peaks[template] = max(peaks[template], event['args'].get('alloc_peak_kib', 0))
+
+        stages = [stage for stage in STAGES if any(stage in row for row in durations.values())]
+        header = f"{'template':<36}" + ''.join(f"{stage:>12}" for stage in stages)
+        if self.memory:
+            header += f"{'alloc KiB':>12}"
+        print(header)
+        totals = defaultdict(float)
+        for template in sorted(durations):
+            row = f"{template[:36]:<36}"
+            for stage in stages:
+                value = durations[template].get(stage)
+                row += f"{value:>12.2f}" if value is not None else f"{'-':>12}"
+                totals[stage] += value or 0
+            if self.memory:
+                row += f"{peaks[template]:>12}"
+            print(row)
+        print(f"{'TOTAL':<36}" + ''.join(f"{totals[stage]:>12.2f}" for stage in stages))
+
+def start(memory=False):
+    """Begin tracing in this process and return the trace"""
+    global _active
+    _active = BuildTrace(memory=memory)
+    return _active
+
+def active():
+    """Return this process's trace, or None when tracing is off"""
+    return _active
+
+def stage(name, template=None):
+    """Context manager recording a stage when tracing is on, and a no-op otherwise"""
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.stage(name, template)
+
+def record(name, template, timestamp, duration, tid=None):
+    """Record a caller-timed stage when tracing is on (see BuildTrace.record)"""
+    if _active is not None:
+        _active.record(name, template, timestamp, duration, tid)
+
+def drain():
+    """Return and clear this process's recorded events, or [] when tracing is off"""
+    return _active.drain() if _active is not None else []
+
+def finish(path):
+    """Write the Chrome trace to path, print the summary table and stop tracing"""
+    global _active
+    trace, _active = _active, None
+    if trace is None:
+        return
+    trace.write_chrome_trace(path)
+    print("=" * 50)
+    trace.print_summary()
+    print(f"🧭 Trace written to {path}")
+    if trace.memory:
+        import tracemalloc
+        tracemalloc.stop()
@@ -4,10 +4,33 @@ VoidSEO Template HTML Generator
 Converts markdown templates to styled HTML with VoidSEO branding
 """
 
-import markdown
+import argparse
+import functools
+import html
 from pathlib import Path
 import os
 
+import build_trace
+from build_manifest import BuildManifest, code_digest, file_digest, text_digest
+from template_minify import minify_css, minify_html, split_css_rules
+from template_sitemap import SITE_URL, update_template_sitemap
+from template_compress import precompress, remove_compressed, remove_stale_compressed
+from template_index import (discover_templates, parse_front_matter, read_front_matter,
+                            skip_front_matter, split_front_matter, template_source)
+
+# Markdown, asyncio and multiprocessing are imported by the functions that use
+# them, so no-op runs and --help do not pay for loading them
+
+# Shared modules whose code is part of every output fingerprint
+GENERATOR_MODULES = ("build_manifest.py", "build_trace.py", "template_index.py", "template_markdown.py",
+                     "template_minify.py", "template_pipeline.py", "template_sitemap.py")
+
+# External stylesheet mode writes voidseo.<hash>.css next to the pages and
+# keeps only the rules needed for the first screen inline
+STYLESHEET_PREFIX = "voidseo"
+CRITICAL_SELECTORS = frozenset(['body', '.header', '.header h1', '.header .subtitle', '.void-symbol',
+                                '.actions', '.btn'])
+
 def create_html_style():
     """Create CSS styling for VoidSEO branded HTML"""
     return """
@@ -293,84 +316,185 @@ def create_html_style():
     </style>
     """
 
-def process_markdown_content(content):
-    """Process markdown content to add special styling"""
-    
-    # Add fill sections for empty fields
-    content = content.replace('- **Project/Module name:** ', 
-        '- **Project/Module name:** \n<div class="fill-section"><p>Enter your project name here</p></div>\n')
-    content = content.replace('- **Author / Team:** ', 
-        '- **Author / Team:** \n<div class="fill-section"><p>Enter author/team name here</p></div>\n')
-    content = content.replace('- **Date:** ', 
-        '- **Date:** \n<div class="fill-section"><p>Enter date here</p></div>\n')
-    content = content.replace('- **Owner:** ', 
-        '- **Owner:** \n<div class="fill-section"><p>Enter owner name here</p></div>\n')
-    
-    # Process sections that need filling
-    lines = content.split('\n')
-    processed_lines = []
-    
-    for line in lines:
-        # Convert empty sections to fill areas
-        if line.strip() in ['What\'s happening? Where does this come from (GSC, SERP, CRM, support, logs…)?',
-                           'State the pattern crisply.',
-                           'What makes this worth solving? Impact on biz/users/process?',
-                           'Who benefits? Persona / team / use case.',
-                           'Short description + why now.']:
-            processed_lines.append('<div class="fill-section"><p>' + line + '</p></div>')
-        else:
-            processed_lines.append(line)
+def split_html_style():
+    """Split the page stylesheet into minified (critical, deferred) CSS"""
+    style = create_html_style().strip()
+    css = style[len('<style>'):-len('</style>')]
+    critical = []
+    deferred = []
+    for prelude, rule in split_css_rules(css):
+        (critical if prelude in CRITICAL_SELECTORS else deferred).append(rule)
+    return minify_css('\n'.join(critical)), minify_css('\n'.join(deferred))
+
+def external_stylesheet_name(deferred):
+    """Return the content-hashed file name of the deferred stylesheet"""
+    return f"{STYLESHEET_PREFIX}.{text_digest(deferred)[:12]}.css"
+
+def external_style_markup(critical, name):
+    """Return the <head> markup that inlines the critical rules and links the stylesheet"""
+    return f'<style>{critical}</style>\n        <link rel="stylesheet" href="{name}">'
+
+def external_style():
+    """Return the <head> markup of an --external-css build without writing the stylesheet"""
+    critical, deferred = split_html_style()
+    return external_style_markup(critical, external_stylesheet_name(deferred))
+
+def write_external_stylesheet(output_dir):
+    """Write the deferred rules as a content-hashed stylesheet and return the <head> markup
+    
+    The file name changes whenever the CSS does, so it can be cached for good.
+    """
+    
+    critical, deferred = split_html_style()
+    name = external_stylesheet_name(deferred)
+    stylesheet_path = Path(output_dir) / name
+    
+    if not stylesheet_path.exists() or stylesheet_path.read_text(encoding='utf-8') != deferred:
+        tmp_path = stylesheet_path.with_name(name + '.tmp')
+        tmp_path.write_text(deferred, encoding='utf-8')
+        os.replace(tmp_path, stylesheet_path)
+        print(f"🎨 Created stylesheet: {stylesheet_path}")
+    
+    # Remove stylesheets left by earlier builds, with their .gz/.br siblings
+    for old_path in Path(output_dir).glob(f"{STYLESHEET_PREFIX}.*.css"):
+        if old_path.name != name:
+            old_path.unlink()
+            remove_compressed(old_path)
     
-    return '\n'.join(processed_lines)
+    return external_style_markup(critical, name)
 
-def markdown_to_html(md_content, template_name, template_description):
-    """Convert markdown content to styled HTML"""
+# Where the generated pages are published, relative to SITE_URL
+PAGES_PATH = "templates/html"
+
+# Default hreflang alternates, all pointing at the canonical URL
+DEFAULT_HREFLANG = ('en-BE', 'x-default')
+
+def page_url(md_file_path):
+    """Return the public URL of a template's HTML page"""
+    return f"{SITE_URL}/{PAGES_PATH}/{Path(md_file_path).stem}.html"
+
+def seo_head_tags(description, canonical, metadata=None):
+    """Return the description, canonical, hreflang and robots tags for a page head
     
-    # Process content
-    processed_content = process_markdown_content(md_content)
+    Front matter may override `canonical`, give `hreflang` as a list of
+    languages served at the canonical URL or a language -> URL mapping, and
+    set `robots` (e.g. "noindex, nofollow").
+    """
     
-    # Convert markdown to HTML
-    html_content = markdown.markdown(processed_content, extensions=['extra', 'codehilite'])
+    metadata = metadata or {}
+    canonical = str(metadata.get('canonical') or canonical)
+    hreflang = metadata.get('hreflang') or DEFAULT_HREFLANG
+    if isinstance(hreflang, str):
+        hreflang = [hreflang]
+    if not isinstance(hreflang, dict):
+        hreflang = {language: canonical for language in hreflang}
     
-    # Convert checkboxes to styled version
-    html_content = html_content.replace('<li>[ ]', '<li class="checkbox-item">☐')
-    html_content = html_content.replace('- [ ]', '☐')
+    tags = [
+        f'<meta name="description" content="{html.escape(description)}">',
+        f'<link rel="canonical" href="{html.escape(canonical)}">',
+    ]
+    for language, url in hreflang.items():
+        tags.append(f'<link rel="alternate" hreflang="{html.escape(str(language))}" href="{html.escape(str(url))}">')
+    if metadata.get('robots'):
+        tags.append(f'<meta name="robots" content="{html.escape(str(metadata["robots"]))}">')
+    return ''.join(f'{tag}\n        ' for tag in tags)
+
+def template_head_tags(md_file_path, metadata=None):
+    """Return the SEO head tags for a template, reading its front matter if not given"""
+    if metadata is None:
+        metadata = read_front_matter(md_file_path)
+    source = template_source(md_file_path, metadata)
+    return seo_head_tags(source.description, page_url(md_file_path), metadata)
+
+def get_template_info(md_file_path, metadata=None):
+    """Return the display name and description for a template file
     
-    # Add warning/tip styling
-    html_content = html_content.replace('<strong>Pitfall to avoid:</strong>', 
-        '<div class="warning"><strong>⚠️ Pitfall to avoid:</strong>')
-    html_content = html_content.replace('Starting from a tool, not a problem.', 
-        'Starting from a tool, not a problem.</div>')
+    Both come from the template's front matter, which is read from the file
+    when metadata is not given.
+    """
+    if metadata is None:
+        metadata = read_front_matter(md_file_path)
+    source = template_source(md_file_path, metadata)
+    return source.name, source.description
+
+@functools.lru_cache(maxsize=None)
+def _shared_fingerprint():
+    """Hashes of the stylesheet and generator code common to every HTML output"""
+    return {
+        'style': text_digest(create_html_style()),
+        'code': code_digest(__file__, *(Path(__file__).with_name(name) for name in GENERATOR_MODULES)),
+    }
+
+def output_fingerprint(source_hash, style=None, minify=False):
+    """Return the build-manifest fingerprint of an HTML page built from source_hash
+    
+    Pass the same style and minify options the page is built with.
+    """
+    fingerprint = {'source': source_hash, **_shared_fingerprint()}
+    if style is not None:
+        fingerprint['head_style'] = text_digest(style)
+    if minify:
+        fingerprint['minify'] = True
+    return fingerprint
+
+def markdown_to_html(md_content, template_name, template_description, style=None):
+    """Convert markdown content to styled HTML"""
+    from template_markdown import convert_markdown
+    
+    # Convert markdown to HTML; fill areas, checkboxes and callouts are
+    # applied by the shared template extension
+    html_content = convert_markdown(md_content)
+    
+    return wrap_html_document(html_content, template_name, template_description, style)
+
+def wrap_html_document(html_content, template_name, template_description, style=None, head_tags=''):
+    """Wrap a converted template body in the interactive HTML page"""
     
     # Create full HTML document
-    full_html = f"""
+    full_html = (html_document_head(template_name, template_description, style, head_tags)
+                 + html_content
+                 + html_document_tail())
+    
+    return full_html
+
+def html_document_head(template_name, template_description, style=None, head_tags=''):
+    """Return the page markup that precedes the template body
+    
+    style replaces the inlined stylesheet, e.g. with write_external_stylesheet()
+    markup, and head_tags (see seo_head_tags()) go before the title.
+    """
+    return f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>{template_name} - VoidSEO</title>
-        {create_html_style()}
+        {head_tags}<title>{html.escape(template_name)} - VoidSEO</title>
+        {style or create_html_style()}
     </head>
     <body>
         <div class="header">
             <h1>VoidSEO <span class="void-symbol">▌</span></h1>
-            <div class="subtitle">{template_name}</div>
+            <div class="subtitle">{html.escape(template_name)}</div>
         </div>
         
         <div class="actions no-print">
             <p><strong>💡 Pro tip:</strong> Use Cmd+P to print or save as PDF</p>
             <a href="#" onclick="window.print()" class="btn">🖨️ Print Template</a>
-            <a href="../VOID_Loop_Templates_v1.zip" class="btn">📦 Download All Templates</a>
+            <a href="../../VOID_Loop_Templates_v1.zip" class="btn">📦 Download All Templates</a>
         </div>
         
         <div class="template-meta">
             <h4>About this template</h4>
-            <p>{template_description}</p>
+            <p>{html.escape(template_description)}</p>
         </div>
         
         <div class="content">
-            {html_content}
+            """
+
+def html_document_tail():
+    """Return the page markup that follows the template body"""
+    return """
         </div>
         
         <div class="footer">
@@ -381,39 +505,119 @@ def markdown_to_html(md_content, template_name, template_description):
     </body>
     </html>
     """
-    
-    return full_html
 
-def generate_html_template(md_file_path, output_dir):
+def generate_html_template(md_file_path, output_dir, style=None, minify=False):
     """Generate HTML from markdown file"""
     
+    file_stem = Path(md_file_path).stem
+    
     # Read markdown file
-    with open(md_file_path, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+    with build_trace.stage('read', file_stem):
+        with open(md_file_path, 'r', encoding='utf-8') as f:
+            md_text = f.read()
+    
+    html_content = render_html_page(md_file_path, md_text, style, minify)
+    
+    # Save HTML file
+    output_path = output_dir / f"{file_stem}.html"
+    return save_html(output_path, html_content)
+
+def render_html_page(md_file_path, md_text, style=None, minify=False):
+    """Turn a template's source text into its finished HTML page"""
+    from template_markdown import convert_markdown
     
-    # Get template info
     file_stem = Path(md_file_path).stem
-    template_name = file_stem.replace('VOID_', '').replace('_', ' ')
-    
-    # Template descriptions
-    descriptions = {
-        'Vision Template': 'A 1-page brief to capture context, patterns, and target impact. Use this to clearly define your problem before starting any development work.',
-        'PRD Template': 'Problem-Requirements-Data template for defining inputs, outputs, constraints, and success metrics before coding.',
-        'Implementation Checklist': 'Step-by-step checklist for building, testing, and documenting your v0.1 module with proper observability.',
-        'Deep Dive Template': 'Structured template for analyzing results, documenting learnings, and making keep/kill/iterate decisions.',
-        'Quick Start Guide': 'Complete guide to your first VOID Loop project. Shows how to go from idea to working automation in 7 hours.'
-    }
+    front_matter, md_content = split_front_matter(md_text)
     
-    template_description = descriptions.get(template_name, 'VOID Loop methodology template')
+    # Get template info
+    metadata = parse_front_matter(front_matter)
+    template_name, template_description = get_template_info(md_file_path, metadata)
+    head_tags = template_head_tags(md_file_path, metadata)
     
-    # Convert to HTML
-    html_content = markdown_to_html(md_content, template_name, template_description)
+    # Convert to HTML; fill areas, checkboxes and callouts are applied by the
+    # shared template extension
+    with build_trace.stage('convert', file_stem):
+        body = convert_markdown(md_content)
+    with build_trace.stage('wrap', file_stem):
+        html_content = wrap_html_document(body, template_name, template_description, style, head_tags)
+    if minify:
+        with build_trace.stage('minify', file_stem):
+            html_content = minify_html(html_content)
     
-    # Save HTML file
+    return html_content
+
+def _init_html_worker(trace_memory=None):
+    """Process pool initializer: mirror the parent's tracing"""
+    if trace_memory is not None:
+        build_trace.start(memory=trace_memory)
+
+def _html_page_worker(md_file_path, md_text, style=None, minify=False):
+    """Pipeline entry point: render one page, returning (error or None, HTML, trace events)"""
+    try:
+        return None, render_html_page(md_file_path, md_text, style, minify), build_trace.drain()
+    except Exception as e:
+        return str(e) or type(e).__name__, None, build_trace.drain()
+
+def generate_html_pipeline(md_file_paths, output_dir, jobs=1, style=None, minify=False):
+    """Generate pages through the asyncio pipeline, yielding (path, success) in input order
+    
+    Source reads and page writes overlap with conversion running in jobs
+    worker processes.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from template_pipeline import run_pipeline
+    
+    trace = build_trace.active()
+    trace_memory = trace.memory if trace is not None else None
+    tasks = [(path, output_dir / f"{Path(path).stem}.html") for path in md_file_paths]
+    convert = functools.partial(_html_page_worker, style=style, minify=minify)
+    
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_html_worker,
+                             initargs=(trace_memory,)) as pool:
+        results = run_pipeline(tasks, convert, pool, converters=jobs)
+        for path, (_, ok) in zip(md_file_paths, results):
+            yield path, ok
+
+def generate_html_template_streaming(md_file_path, output_dir, max_chunk=None, style=None, minify=False):
+    """Generate HTML from a markdown file with bounded memory
+    
+    The source is converted block by block and the page head, body fragments
+    and tail are written as they are produced, so peak memory follows the
+    chunk size (default STREAM_CHUNK_SIZE) rather than the document size.
+    """
+    from template_markdown import STREAM_CHUNK_SIZE, convert_markdown_stream
+    
+    max_chunk = max_chunk or STREAM_CHUNK_SIZE
+    file_stem = Path(md_file_path).stem
+    metadata = read_front_matter(md_file_path)
+    template_name, template_description = get_template_info(md_file_path, metadata)
+    head_tags = template_head_tags(md_file_path, metadata)
     output_path = output_dir / f"{file_stem}.html"
     
+    # Chunks end between blocks, so each piece can be minified on its own
+    finish = minify_html if minify else str
+    
     try:
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with build_trace.stage('stream', file_stem), \
+                open(md_file_path, 'r', encoding='utf-8') as source, \
+                open(output_path, 'w', encoding='utf-8') as f:
+            f.write(finish(html_document_head(template_name, template_description, style, head_tags)))
+            for index, fragment in enumerate(convert_markdown_stream(skip_front_matter(source), max_chunk)):
+                if index:
+                    f.write('\n')
+                f.write(finish(fragment))
+            f.write(finish(html_document_tail()))
+        print(f"✅ Generated: {output_path}")
+        return True
+    except Exception as e:
+        print(f"❌ Error generating {output_path}: {e}")
+        return False
+
+def save_html(output_path, html_content):
+    """Write a generated page and report the result"""
+    try:
+        with build_trace.stage('write', Path(output_path).stem), \
+                open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
         print(f"✅ Generated: {output_path}")
         return True
@@ -421,45 +625,123 @@ def generate_html_template(md_file_path, output_dir):
         print(f"❌ Error generating {output_path}: {e}")
         return False
 
-def main():
+def main(argv=None):
     """Main function to generate all HTML templates"""
     
+    parser = argparse.ArgumentParser(description="Generate VoidSEO HTML templates")
+    parser.add_argument('--force', action='store_true', help="rebuild every template even if unchanged")
+    parser.add_argument('--stream', action='store_true',
+                        help="convert and write each template block by block to bound memory use")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="overlap source reads and page writes with conversion (asyncio pipeline)")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="conversion processes for --pipeline (0 = one per CPU core)")
+    parser.add_argument('--external-css', action='store_true',
+                        help="link a shared, content-hashed stylesheet instead of inlining it in every page")
+    parser.add_argument('--minify', action='store_true',
+                        help="strip whitespace and comments from the generated pages")
+    parser.add_argument('--precompress', action='store_true',
+                        help="also write .gz and .br copies of every generated page")
+    parser.add_argument('--no-sitemap', dest='sitemap', action='store_false',
+                        help="do not merge the generated pages into sitemap.xml")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write per-stage timings as Chrome trace JSON and print a summary")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="also record allocation peaks per stage (slower)")
+    args = parser.parse_args(argv)
+    if args.trace:
+        build_trace.start(memory=args.trace_memory)
+    generate = generate_html_template_streaming if args.stream else generate_html_template
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    
     # Setup paths
     base_dir = Path(__file__).parent
     output_dir = base_dir / "templates" / "html"
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Template files to convert
-    template_files = [
-        "VOID_Vision_Template.md",
-        "VOID_PRD_Template.md", 
-        "VOID_Implementation_Checklist.md",
-        "VOID_Deep_Dive_Template.md",
-        "VOID_Quick_Start_Guide.md"
-    ]
-    
     print("🚀 Generating VoidSEO HTML Templates...")
     print("=" * 50)
     
+    style = write_external_stylesheet(output_dir) if args.external_css else None
+    manifest = BuildManifest(output_dir)
+    
     success_count = 0
+    skipped_count = 0
+    pending = []
     
-    for template_file in template_files:
-        file_path = base_dir / template_file
+    sources = discover_templates(base_dir)
+    
+    for source in sources:
+        file_path = source.path
         if file_path.exists():
-            if generate_html_template(file_path, output_dir):
+            output_path = output_dir / f"{file_path.stem}.html"
+            fingerprint = output_fingerprint(file_digest(file_path), style, args.minify)
+            if not args.force and manifest.is_fresh(output_path, fingerprint):
+                print(f"⏭️  Up to date: {output_path}")
                 success_count += 1
+                skipped_count += 1
+            else:
+                pending.append((file_path, output_path, fingerprint))
+        else:
+            print(f"⚠️  File not found: {file_path}")
+    
+    # Generate stale templates one by one, or overlapped through the pipeline
+    paths = [file_path for file_path, _, _ in pending]
+    if args.pipeline and paths:
+        results = generate_html_pipeline(paths, output_dir, jobs, style=style, minify=args.minify)
+    else:
+        results = ((path, generate(path, output_dir, style=style, minify=args.minify)) for path in paths)
+    
+    for (file_path, output_path, fingerprint), (_, ok) in zip(pending, results):
+        if ok:
+            manifest.record(output_path, fingerprint)
+            success_count += 1
         else:
-            print(f"⚠️  File not found: {template_file}")
+            manifest.forget(output_path)
+    
+    manifest.save()
     
     print("=" * 50)
-    print(f"✨ Generated {success_count}/{len(template_files)} HTML templates")
+    print(f"✨ Generated {success_count}/{len(sources)} HTML templates ({skipped_count} up to date)")
     print(f"📁 Output directory: {output_dir}")
     
     # Create index
-    create_html_index(output_dir)
+    create_html_index(output_dir, style, minify=args.minify, sources=sources)
+    
+    if args.sitemap:
+        update_template_sitemap(base_dir, sources, output_dir)
+    
+    pages = sorted([*output_dir.glob("*.html"), *output_dir.glob("*.css")])
+    if args.precompress:
+        precompress(pages, force=args.force)
+    else:
+        # Siblings from an earlier --precompress run would shadow the rewritten pages
+        remove_stale_compressed(pages)
+    
+    if args.trace:
+        build_trace.finish(args.trace)
+
+def html_index_cards(sources):
+    """Return one index card per template, in build order"""
+    cards = []
+    for source in sources:
+        cards.append(f"""
+            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
+                <h3>{html.escape(source.name)}</h3>
+                <p>{html.escape(source.description)}</p>
+                <a href="{html.escape(source.path.stem)}.html" class="btn">📄 Open Template</a>
+            </div>
+            """)
+    return ''.join(cards)
 
-def create_html_index(output_dir):
-    """Create an index HTML file for all templates"""
+def create_html_index(output_dir, style=None, minify=False, sources=None):
+    """Create an index HTML file for all templates
+    
+    Cards are built from sources, discovered next to this script when not given.
+    """
+    
+    if sources is None:
+        sources = discover_templates(Path(__file__).parent)
     
     index_html = f"""
     <!DOCTYPE html>
@@ -467,8 +749,8 @@ def create_html_index(output_dir):
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>VoidSEO HTML Templates</title>
-        {create_html_style()}
+        {seo_head_tags("Printable VOID Loop methodology templates from VoidSEO", f"{SITE_URL}/{PAGES_PATH}/")}<title>VoidSEO HTML Templates</title>
+        {style or create_html_style()}
     </head>
     <body>
         <div class="header">
@@ -483,37 +765,7 @@ def create_html_index(output_dir):
         
         <h2>Available Templates</h2>
         
-        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 30px 0;">
-            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
-                <h3>Vision Template</h3>
-                <p>1-page brief to capture context, pattern, and target impact</p>
-                <a href="VOID_Vision_Template.html" class="btn">📄 Open Template</a>
-            </div>
-            
-            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
-                <h3>PRD Template</h3>
-                <p>Problem-Requirements-Data template for technical specs</p>
-                <a href="VOID_PRD_Template.html" class="btn">📄 Open Template</a>
-            </div>
-            
-            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
-                <h3>Implementation Checklist</h3>
-                <p>Step-by-step checklist for building and documenting</p>
-                <a href="VOID_Implementation_Checklist.html" class="btn">📄 Open Template</a>
-            </div>
-            
-            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
-                <h3>Deep Dive Template</h3>
-                <p>Structured template for analyzing results and learnings</p>
-                <a href="VOID_Deep_Dive_Template.html" class="btn">📄 Open Template</a>
-            </div>
-            
-            <div style="border: 2px solid #00ff99; padding: 20px; border-radius: 8px; background: #f8f9fa;">
-                <h3>Quick Start Guide</h3>
-                <p>Complete guide to your first VOID Loop in 7 hours</p>
-                <a href="VOID_Quick_Start_Guide.html" class="btn">📄 Open Template</a>
-            </div>
-        </div>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 30px 0;">{html_index_cards(sources)}</div>
         
         <div class="tip">
             <h4>💡 How to use these templates:</h4>
@@ -533,6 +785,9 @@ def create_html_index(output_dir):
     </html>
     """
     
+    if minify:
+        index_html = minify_html(index_html)
+    
     index_path = output_dir / "index.html"
     with open(index_path, 'w', encoding='utf-8') as f:
         f.write(index_html)
@@ -4,11 +4,50 @@ VoidSEO Template PDF Generator
 Converts markdown templates to styled PDFs with VoidSEO branding
 """
 
-import markdown
-from weasyprint import HTML, CSS
+import argparse
+import contextlib
+import functools
+import html
+from collections import namedtuple
 from pathlib import Path
 import os
 
+import build_trace
+from build_manifest import BuildManifest, code_digest, file_digest, text_digest
+from template_index import discover_templates, parse_front_matter, split_front_matter, template_source
+from template_compress import remove_stale_compressed
+from template_minify import minify_html
+
+# WeasyPrint (pango, cairo, fontTools), Markdown, asyncio and multiprocessing
+# are imported by the functions that use them, so no-op runs and --help stay fast
+
+# Shared modules whose code is part of every output fingerprint
+GENERATOR_MODULES = ("build_manifest.py", "build_trace.py", "template_index.py", "template_markdown.py",
+                     "template_minify.py", "template_pipeline.py", "worker_pool.py")
+
+# Worker recycling for pooled runs: WeasyPrint's memory does not always
+# return to baseline between documents, so long runs replace their workers
+DEFAULT_MAX_TASKS_PER_WORKER = 100
+DEFAULT_MAX_WORKER_RSS_MB = 1024
+
+WorkerLimits = namedtuple('WorkerLimits', ['max_tasks', 'max_rss_mb'],
+                          defaults=(DEFAULT_MAX_TASKS_PER_WORKER, DEFAULT_MAX_WORKER_RSS_MB))
+
+# Combined PDF of every template, written by --bundle
+BUNDLE_NAME = "VOID_Loop_Templates.pdf"
+BUNDLE_TITLE = "VoidSEO VOID Loop Templates"
+
+# write_pdf options for --optimize: recompress and downsample images. Font
+# subsetting and compressed streams are already WeasyPrint's defaults.
+OPTIMIZE_OPTIONS = {
+    'optimize_images': True,
+    'jpeg_quality': 85,
+    'dpi': 150,
+}
+
+# Document info entries --optimize keeps; Producer, dates and the rest are dropped
+KEPT_PDF_INFO = frozenset(['Title'])
+
 def create_pdf_style():
     """Create CSS styling for VoidSEO branded PDFs"""
     return """
@@ -52,6 +91,7 @@ def create_pdf_style():
         font-family: 'Monaco', 'Menlo', monospace;
         font-size: 24px;
         font-weight: bold;
+        bookmark-level: none;
     }
     
     .header .subtitle {
@@ -59,8 +99,18 @@ def create_pdf_style():
         font-size: 14px;
         color: #cccccc;
         font-family: 'Monaco', 'Menlo', monospace;
+        bookmark-level: 1;
+        bookmark-label: content(text);
     }
     
+    /* Template headings nest under the template's own bookmark */
+    .content h1 { bookmark-level: 2; }
+    .content h2 { bookmark-level: 3; }
+    .content h3 { bookmark-level: 4; }
+    .content h4 { bookmark-level: 5; }
+    .content h5 { bookmark-level: 6; }
+    .content h6 { bookmark-level: 7; }
+    
     .void-symbol {
         color: #00ff99;
         font-family: 'Monaco', 'Menlo', monospace;
@@ -172,7 +222,7 @@ def create_pdf_style():
         font-size: 14px;
     }
     
-    .fill-area {
+    .fill-section {
         border: 1px dashed #ccc;
         background: #fafafa;
         padding: 15px;
@@ -181,7 +231,7 @@ def create_pdf_style():
         border-radius: 3px;
     }
     
-    .fill-area:before {
+    .fill-section:before {
         content: "✏️ Fill this section:";
         display: block;
         font-size: 12px;
@@ -190,6 +240,24 @@ def create_pdf_style():
         font-weight: 600;
     }
     
+    .fill-section p {
+        margin: 0;
+        color: #999;
+        font-style: italic;
+    }
+    
+    .warning {
+        background: #fff3cd;
+        border-left: 4px solid #ffc107;
+        color: #856404;
+        padding: 10px 15px;
+        margin: 15px 0;
+    }
+    
+    .warning p {
+        margin: 0;
+    }
+    
     .footer {
         margin-top: 40px;
         padding-top: 20px;
@@ -225,23 +293,33 @@ def create_pdf_style():
     }
     """
 
+@functools.lru_cache(maxsize=None)
+def _shared_fingerprint():
+    """Hashes of the stylesheet and generator code common to every PDF output"""
+    return {
+        'style': text_digest(create_pdf_style()),
+        'code': code_digest(__file__, *(Path(__file__).with_name(name) for name in GENERATOR_MODULES)),
+    }
+
+def output_fingerprint(source_hash, optimize=False):
+    """Return the build-manifest fingerprint of a PDF built from source_hash"""
+    fingerprint = {'source': source_hash, **_shared_fingerprint()}
+    if optimize:
+        fingerprint['optimize'] = True
+    return fingerprint
+
 def markdown_to_html(md_content, template_name):
     """Convert markdown content to styled HTML"""
+    from template_markdown import convert_markdown
     
-    # Convert markdown to HTML
-    html_content = markdown.markdown(md_content, extensions=['extra', 'codehilite'])
-    
-    # Add fill areas for empty sections
-    html_content = html_content.replace('- **Project/Module name:** ', 
-        '- **Project/Module name:** <div class="fill-area"></div>')
-    html_content = html_content.replace('- **Author / Team:** ', 
-        '- **Author / Team:** <div class="fill-area"></div>')
-    html_content = html_content.replace('- **Date:** ', 
-        '- **Date:** <div class="fill-area"></div>')
+    # Convert markdown to HTML; fill areas, checkboxes and callouts are
+    # applied by the shared template extension
+    html_content = convert_markdown(md_content)
     
-    # Convert checkboxes
-    html_content = html_content.replace('<li>[ ]', '<li class="checkbox-item">☐')
-    html_content = html_content.replace('- [ ]', '<li class="checkbox-item">☐')
+    return wrap_pdf_document(html_content, template_name)
+
+def wrap_pdf_document(html_content, template_name):
+    """Wrap a converted template body in the print document laid out by WeasyPrint"""
     
     # Create full HTML document
     full_html = f"""
@@ -249,12 +327,12 @@ def markdown_to_html(md_content, template_name):
     <html>
     <head>
         <meta charset="UTF-8">
-        <title>{template_name} - VoidSEO</title>
+        <title>{html.escape(template_name)} - VoidSEO</title>
     </head>
     <body>
         <div class="header">
             <h1>VoidSEO <span class="void-symbol">▌</span></h1>
-            <div class="subtitle">{template_name}</div>
+            <div class="subtitle">{html.escape(template_name)}</div>
         </div>
         
         <div class="content">
@@ -271,75 +349,452 @@ def markdown_to_html(md_content, template_name):
     
     return full_html
 
-def generate_pdf(md_file_path, output_dir):
-    """Generate PDF from markdown file"""
+def make_caching_url_fetcher():
+    """Create a url_fetcher that serves repeated resource URLs from memory"""
+    try:
+        from weasyprint.urls import URLFetcher, URLFetcherResponse
+    except ImportError:  # WeasyPrint releases that still use fetcher functions
+        from weasyprint import default_url_fetcher
+        URLFetcher = None
+    
+    cache = {}
+    
+    if URLFetcher is None:
+        def fetch(url, *args, **kwargs):
+            if url not in cache:
+                result = default_url_fetcher(url, *args, **kwargs)
+                if 'file_obj' in result:
+                    result['string'] = result.pop('file_obj').read()
+                cache[url] = result
+            return dict(cache[url])
+        return fetch
+    
+    class CachingURLFetcher(URLFetcher):
+        def fetch(self, url, headers=None):
+            if url not in cache:
+                response = super().fetch(url, headers)
+                try:
+                    cache[url] = (response.url, response.read(), response.headers, response.status)
+                finally:
+                    response.close()
+            final_url, body, response_headers, status = cache[url]
+            return URLFetcherResponse(final_url, body, response_headers, status)
+    
+    return CachingURLFetcher()
+
+class PdfRenderContext:
+    """Parsed stylesheet, fonts and resource caches shared by every PDF in a process"""
+    
+    def __init__(self):
+        from weasyprint import CSS
+        from weasyprint.text.fonts import FontConfiguration
+        self.font_config = FontConfiguration()
+        self.url_fetcher = make_caching_url_fetcher()
+        self.stylesheet = CSS(string=create_pdf_style(), font_config=self.font_config,
+                              url_fetcher=self.url_fetcher)
+        self.image_cache = {}
+    
+    def render(self, html_content, base_url=None):
+        """Lay out html_content with the shared stylesheet and return the Document"""
+        from weasyprint import HTML
+        return HTML(string=html_content, base_url=base_url, url_fetcher=self.url_fetcher).render(
+            stylesheets=[self.stylesheet],
+            font_config=self.font_config,
+            cache=self.image_cache
+        )
+    
+    def write_pdf(self, html_content, output_path, base_url=None):
+        """Lay out html_content with the shared stylesheet and write it as a PDF"""
+        label = Path(output_path).stem
+        with build_trace.stage('layout', label):
+            document = self.render(html_content, base_url)
+        with build_trace.stage('write', label):
+            document.write_pdf(output_path)
+
+_render_context = None
+
+def get_render_context():
+    """Return this process's render context, creating it on first use"""
+    global _render_context
+    if _render_context is None:
+        _render_context = PdfRenderContext()
+    return _render_context
+
+def render_pdf_document(md_file_path, context=None):
+    """Read, convert and lay out a markdown template, returning the WeasyPrint Document"""
     
     # Read markdown file
-    with open(md_file_path, 'r', encoding='utf-8') as f:
-        md_content = f.read()
+    with build_trace.stage('read', Path(md_file_path).stem):
+        with open(md_file_path, 'r', encoding='utf-8') as f:
+            md_text = f.read()
+    
+    return layout_pdf_document(md_file_path, md_text, context)
+
+def layout_pdf_document(md_file_path, md_text, context=None):
+    """Convert and lay out a template's source text, returning the WeasyPrint Document"""
+    from template_markdown import convert_markdown
+    
+    file_stem = Path(md_file_path).stem
+    front_matter, md_content = split_front_matter(md_text)
     
     # Get template name
-    template_name = Path(md_file_path).stem.replace('VOID_', '').replace('_', ' ')
+    template_name = template_source(md_file_path, parse_front_matter(front_matter)).name
+    
+    # Convert to HTML; fill areas, checkboxes and callouts are applied by the
+    # shared template extension
+    with build_trace.stage('convert', file_stem):
+        body = convert_markdown(md_content)
+    with build_trace.stage('wrap', file_stem):
+        html_content = wrap_pdf_document(body, template_name)
+    
+    # Lay out with the warm stylesheet, fonts and caches
+    context = context or get_render_context()
+    with build_trace.stage('layout', file_stem):
+        return context.render(html_content, base_url=str(Path(md_file_path).resolve().parent))
+
+def strip_pdf_info(document, pdf):
+    """write_pdf finisher: drop document info entries other than KEPT_PDF_INFO"""
+    for key in list(pdf.info):
+        if key not in KEPT_PDF_INFO:
+            del pdf.info[key]
+
+def write_document(document, output_path, optimize=False):
+    """Write a laid-out Document as a PDF, returning (previous size or None, size) when optimizing
     
-    # Convert to HTML
-    html_content = markdown_to_html(md_content, template_name)
+    The previous size is that of the file being replaced, usually the
+    output of a build without --optimize; the Document is serialized once.
+    """
+    with build_trace.stage('write', Path(output_path).stem):
+        if not optimize:
+            document.write_pdf(output_path)
+            return None
+        previous = os.path.getsize(output_path) if os.path.exists(output_path) else None
+        document.write_pdf(output_path, finisher=strip_pdf_info, **OPTIMIZE_OPTIONS)
+        return previous, os.path.getsize(output_path)
+
+def report_size(output_path, sizes):
+    """Print an optimized PDF's size against the file it replaced"""
+    previous, size = sizes
+    if not previous:
+        print(f"📉 {Path(output_path).name}: {size:,} bytes")
+        return
+    saved = 100 * (previous - size) / previous
+    change = f"{saved:.0f}% smaller" if saved >= 0 else f"{-saved:.0f}% larger"
+    print(f"📉 {Path(output_path).name}: {previous:,} → {size:,} bytes ({change})")
+
+def render_pdf(md_file_path, output_dir, context=None, optimize=False):
+    """Render a markdown file to PDF, returning (Document, write_document() sizes or None)"""
     
-    # Create CSS
-    css_content = create_pdf_style()
+    output_path = output_dir / f"{Path(md_file_path).stem}.pdf"
+    document = render_pdf_document(md_file_path, context)
+    sizes = write_document(document, output_path, optimize)
+    return document, sizes
+
+def generate_pdf(md_file_path, output_dir, documents=None, optimize=False):
+    """Generate PDF from markdown file, keeping its Document in documents if given"""
     
-    # Generate PDF
     output_path = output_dir / f"{Path(md_file_path).stem}.pdf"
     
     try:
-        HTML(string=html_content).write_pdf(
-            output_path,
-            stylesheets=[CSS(string=css_content)]
-        )
+        document, sizes = render_pdf(md_file_path, output_dir, optimize=optimize)
+        print(f"✅ Generated: {output_path}")
+    except Exception as e:
+        print(f"❌ Error generating {output_path}: {e}")
+        return False
+    
+    if sizes is not None:
+        report_size(output_path, sizes)
+    if documents is not None:
+        documents.append(document)
+    return True
+
+def write_pdf_bundle(documents, output_path, optimize=False):
+    """Write already laid-out Documents as one PDF without laying them out again
+    
+    Pages keep their own template's page numbers; each template's subtitle is
+    a top-level bookmark with its headings nested below it. Returns the
+    write_document() sizes when optimizing.
+    """
+    
+    pages = [page for document in documents for page in document.pages]
+    bundle = documents[0].copy(pages)
+    bundle.metadata.title = BUNDLE_TITLE
+    return write_document(bundle, output_path, optimize)
+
+def generate_pdf_document(html_document, output_path, base_url=None):
+    """Generate a PDF from an already wrapped document"""
+    
+    try:
+        get_render_context().write_pdf(html_document, output_path, base_url=base_url)
         print(f"✅ Generated: {output_path}")
         return True
     except Exception as e:
         print(f"❌ Error generating {output_path}: {e}")
         return False
 
-def main():
+def _init_pdf_worker(trace_memory=None):
+    """Process pool initializer: warm the render context and mirror the parent's tracing"""
+    if trace_memory is not None:
+        build_trace.start(memory=trace_memory)
+    get_render_context()
+
+def _pdf_worker(md_file_path, output_dir, optimize=False):
+    """Process pool entry point: render one PDF, returning (error or None, trace events, sizes)"""
+    try:
+        _, sizes = render_pdf(md_file_path, output_dir, optimize=optimize)
+        return None, build_trace.drain(), sizes
+    except Exception as e:
+        return str(e) or type(e).__name__, build_trace.drain(), None
+
+def _pdf_document_worker(html_document, output_path, base_url):
+    """Process pool entry point: lay out an already wrapped document as a PDF"""
+    try:
+        get_render_context().write_pdf(html_document, output_path, base_url=base_url)
+        return None, build_trace.drain(), None
+    except Exception as e:
+        return str(e) or type(e).__name__, build_trace.drain(), None
+
+def _pdf_bytes_worker(md_file_path, md_text):
+    """Pipeline entry point: lay out a template's source text, returning (error, PDF bytes, trace events)"""
+    try:
+        document = layout_pdf_document(md_file_path, md_text)
+        with build_trace.stage('write', Path(md_file_path).stem):
+            pdf = document.write_pdf()
+        return None, pdf, build_trace.drain()
+    except Exception as e:
+        return str(e) or type(e).__name__, None, build_trace.drain()
+
+def make_pdf_pool(jobs, limits=None):
+    """Create the recycling worker pool PDFs are laid out in"""
+    from worker_pool import RecyclingPool
+    
+    limits = limits or WorkerLimits()
+    trace = build_trace.active()
+    trace_memory = trace.memory if trace is not None else None
+    return RecyclingPool(jobs, initializer=_init_pdf_worker, initargs=(trace_memory,),
+                         max_tasks=limits.max_tasks, max_rss=limits.max_rss_mb * 1024 * 1024)
+
+def report_recycling(pool):
+    """Print how often the pool replaced its workers and retried documents"""
+    if pool.recycled:
+        print(f"♻️  Recycled PDF workers {pool.recycled} times ({len(pool.retries)} documents retried)")
+
+def add_worker_limit_options(parser):
+    """Add the --max-tasks-per-worker / --max-worker-rss options of pooled PDF runs"""
+    parser.add_argument('--max-tasks-per-worker', type=int, default=DEFAULT_MAX_TASKS_PER_WORKER, metavar='N',
+                        help=f"replace a PDF worker after N documents (default {DEFAULT_MAX_TASKS_PER_WORKER}, "
+                             "0 = never)")
+    parser.add_argument('--max-worker-rss', type=int, default=DEFAULT_MAX_WORKER_RSS_MB, metavar='MB',
+                        help=f"RSS ceiling per PDF worker; a document crossing it is retried once in a fresh "
+                             f"worker (default {DEFAULT_MAX_WORKER_RSS_MB}, 0 = none)")
+
+def worker_limits(args):
+    """Return the WorkerLimits selected by add_worker_limit_options()"""
+    return WorkerLimits(max(args.max_tasks_per_worker, 0), max(args.max_worker_rss, 0))
+
+def run_pdf_pool(worker, tasks, jobs, limits=None, pool=None):
+    """Run worker(*args) for each (output_path, args) task across a recycling process pool
+    
+    Results are reported and yielded as (output_path, success) in task order,
+    so logs are stable across runs. A pool from make_pdf_pool() is reused
+    and left running for the caller to shut down; otherwise one is created
+    for these tasks.
+    """
+    trace = build_trace.active()
+    owned = pool is None
+    with (make_pdf_pool(min(jobs, len(tasks)), limits) if owned else contextlib.nullcontext(pool)) as pool:
+        futures = [pool.submit(worker, *args) for _, args in tasks]
+        
+        for number, ((output_path, _), future) in enumerate(zip(tasks, futures), 1):
+            try:
+                error, events, sizes = future.result()
+            except Exception as e:
+                error, events, sizes = f"worker failed: {e}", [], None
+            if trace is not None:
+                trace.merge(events)
+            if future in pool.retries:
+                print(f"🔁 Retried in a fresh worker: {output_path} ({pool.retries[future]})")
+            if error is None:
+                print(f"✅ Generated: {output_path}")
+                if sizes is not None:
+                    report_size(output_path, sizes)
+            else:
+                print(f"❌ Error generating {output_path}: {error}")
+            if owned and number == len(tasks):
+                # Callers zip these results and never resume the generator after the last one
+                pool.shutdown()
+                report_recycling(pool)
+            yield output_path, error is None
+
+def generate_pdfs_parallel(md_file_paths, output_dir, jobs, optimize=False, limits=None):
+    """Render PDFs across a process pool, yielding (path, success) in input order"""
+    tasks = [(output_dir / f"{Path(path).stem}.pdf", (path, output_dir, optimize)) for path in md_file_paths]
+    for path, (_, ok) in zip(md_file_paths, run_pdf_pool(_pdf_worker, tasks, jobs, limits)):
+        yield path, ok
+
+def generate_pdfs_pipeline(md_file_paths, output_dir, jobs, limits=None):
+    """Render PDFs through the asyncio pipeline, yielding (path, success) in input order
+    
+    Source reads and PDF writes overlap with layout running in jobs worker processes.
+    """
+    from template_pipeline import run_pipeline
+    
+    tasks = [(path, output_dir / f"{Path(path).stem}.pdf") for path in md_file_paths]
+    
+    with make_pdf_pool(jobs, limits) as pool:
+        results = list(run_pipeline(tasks, _pdf_bytes_worker, pool, converters=jobs))
+    report_recycling(pool)
+    for path, (_, ok) in zip(md_file_paths, results):
+        yield path, ok
+
+def main(argv=None):
     """Main function to generate all PDF templates"""
     
+    parser = argparse.ArgumentParser(description="Generate VoidSEO PDF templates")
+    parser.add_argument('--force', action='store_true', help="rebuild every template even if unchanged")
+    parser.add_argument('--jobs', '-j', type=int, default=1, metavar='N',
+                        help="render N PDFs in parallel (0 = one per CPU core)")
+    parser.add_argument('--pipeline', action='store_true',
+                        help="overlap source reads and PDF writes with layout (asyncio pipeline)")
+    parser.add_argument('--bundle', action='store_true',
+                        help=f"also write {BUNDLE_NAME} combining every template")
+    parser.add_argument('--optimize', action='store_true',
+                        help="downsample and recompress images and strip metadata, reporting each PDF's size "
+                             "against the file it replaces")
+    parser.add_argument('--trace', metavar='PATH',
+                        help="write per-stage timings as Chrome trace JSON and print a summary")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="also record allocation peaks per stage (slower)")
+    add_worker_limit_options(parser)
+    args = parser.parse_args(argv)
+    if args.trace:
+        build_trace.start(memory=args.trace_memory)
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    limits = worker_limits(args)
+    if args.optimize and args.pipeline:
+        # Pipeline workers hand back PDF bytes only, with no room for the size report
+        print("ℹ️  --optimize reports sizes per file; ignoring --pipeline")
+        args.pipeline = False
+    
     # Setup paths
     base_dir = Path(__file__).parent
     output_dir = base_dir / "templates" / "pdf"
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Template files to convert
-    template_files = [
-        "VOID_Vision_Template.md",
-        "VOID_PRD_Template.md", 
-        "VOID_Implementation_Checklist.md",
-        "VOID_Deep_Dive_Template.md",
-        "VOID_Quick_Start_Guide.md"
-    ]
-    
     print("🚀 Generating VoidSEO PDF Templates...")
     print("=" * 50)
     
+    manifest = BuildManifest(output_dir)
+    
     success_count = 0
+    skipped_count = 0
+    pending = []
+    
+    sources = discover_templates(base_dir)
     
-    for template_file in template_files:
-        file_path = base_dir / template_file
+    templates = []
+    for source in sources:
+        file_path = source.path
         if file_path.exists():
-            if generate_pdf(file_path, output_dir):
-                success_count += 1
+            output_path = output_dir / f"{file_path.stem}.pdf"
+            templates.append((file_path, output_path, output_fingerprint(file_digest(file_path), args.optimize)))
+        else:
+            print(f"⚠️  File not found: {file_path}")
+    
+    # The bundle needs every template's Document, so a stale bundle lays out
+    # all templates once and writes their single PDFs from the same render
+    bundle_path = output_dir / BUNDLE_NAME
+    bundle_fingerprint = {
+        'sources': [fingerprint['source'] for _, _, fingerprint in templates],
+        **_shared_fingerprint(),
+    }
+    if args.optimize:
+        bundle_fingerprint['optimize'] = True
+    build_bundle = args.bundle and bool(templates) and (
+        args.force or not manifest.is_fresh(bundle_path, bundle_fingerprint))
+    if build_bundle and (jobs > 1 or args.pipeline):
+        # Laid-out Documents cannot be shared between processes
+        print("ℹ️  Rebuilding the bundle in-process; ignoring --jobs and --pipeline")
+        jobs = 1
+        args.pipeline = False
+    
+    for file_path, output_path, fingerprint in templates:
+        if not args.force and not build_bundle and manifest.is_fresh(output_path, fingerprint):
+            print(f"⏭️  Up to date: {output_path}")
+            success_count += 1
+            skipped_count += 1
         else:
-            print(f"⚠️  File not found: {template_file}")
+            pending.append((file_path, output_path, fingerprint))
+    
+    # Render stale templates, serially or across a process pool; a serial run
+    # longer than one worker's task budget goes through a single recycled worker
+    paths = [file_path for file_path, _, _ in pending]
+    documents = [] if build_bundle else None
+    if args.pipeline and paths:
+        results = generate_pdfs_pipeline(paths, output_dir, jobs, limits)
+    elif (jobs > 1 and len(paths) > 1) or (not build_bundle and limits.max_tasks and len(paths) > limits.max_tasks):
+        results = generate_pdfs_parallel(paths, output_dir, jobs, optimize=args.optimize, limits=limits)
+    else:
+        results = ((path, generate_pdf(path, output_dir, documents, optimize=args.optimize)) for path in paths)
+    
+    for (file_path, output_path, fingerprint), (_, ok) in zip(pending, results):
+        if ok:
+            manifest.record(output_path, fingerprint)
+            success_count += 1
+        else:
+            manifest.forget(output_path)
+    
+    if build_bundle:
+        if len(documents) == len(templates):
+            try:
+                sizes = write_pdf_bundle(documents, bundle_path, optimize=args.optimize)
+                manifest.record(bundle_path, bundle_fingerprint)
+                print(f"📚 Bundled {len(documents)} templates: {bundle_path}")
+                if sizes is not None:
+                    report_size(bundle_path, sizes)
+            except Exception as e:
+                manifest.forget(bundle_path)
+                print(f"❌ Error generating {bundle_path}: {e}")
+        else:
+            manifest.forget(bundle_path)
+            print(f"⚠️  Skipping {bundle_path}: not every template rendered")
+    elif args.bundle and templates:
+        print(f"⏭️  Up to date: {bundle_path}")
+    
+    manifest.save()
     
     print("=" * 50)
-    print(f"✨ Generated {success_count}/{len(template_files)} PDF templates")
+    print(f"✨ Generated {success_count}/{len(sources)} PDF templates ({skipped_count} up to date)")
     print(f"📁 Output directory: {output_dir}")
     
-    # Create a combined PDF index
-    create_pdf_index(output_dir)
+    # Create a combined PDF index; a build_templates --precompress run may have compressed the old one
+    create_pdf_index(output_dir, sources=sources)
+    remove_stale_compressed([output_dir / "index.html"])
+    
+    if args.trace:
+        build_trace.finish(args.trace)
+
+def pdf_index_cards(sources):
+    """Return one index card per template, in build order"""
+    cards = []
+    for source in sources:
+        cards.append(f"""
+            <div class="template-card">
+                <h3>{html.escape(source.name)}</h3>
+                <p>{html.escape(source.description)}</p>
+                <a href="{html.escape(source.path.stem)}.pdf" class="download-btn">Download PDF</a>
+            </div>
+            """)
+    return ''.join(cards)
 
-def create_pdf_index(output_dir):
-    """Create an index HTML file for all PDFs"""
+def create_pdf_index(output_dir, minify=False, sources=None):
+    """Create an index HTML file for all PDFs
+    
+    Cards are built from sources, discovered next to this script when not given.
+    """
+    
+    if sources is None:
+        sources = discover_templates(Path(__file__).parent)
     
     index_html = """
     <!DOCTYPE html>
@@ -362,37 +817,7 @@ def create_pdf_index(output_dir):
             <p>Professional templates for the VOID Loop methodology</p>
         </div>
         
-        <div class="template-list">
-            <div class="template-card">
-                <h3>Vision Template</h3>
-                <p>1-page brief to capture context, pattern, and target impact</p>
-                <a href="VOID_Vision_Template.pdf" class="download-btn">Download PDF</a>
-            </div>
-            
-            <div class="template-card">
-                <h3>PRD Template</h3>
-                <p>Problem-Requirements-Data template for technical specs</p>
-                <a href="VOID_PRD_Template.pdf" class="download-btn">Download PDF</a>
-            </div>
-            
-            <div class="template-card">
-                <h3>Implementation Checklist</h3>
-                <p>Step-by-step checklist for building and documenting</p>
-                <a href="VOID_Implementation_Checklist.pdf" class="download-btn">Download PDF</a>
-            </div>
-            
-            <div class="template-card">
-                <h3>Deep Dive Template</h3>
-                <p>Structured template for analyzing results and learnings</p>
-                <a href="VOID_Deep_Dive_Template.pdf" class="download-btn">Download PDF</a>
-            </div>
-            
-            <div class="template-card">
-                <h3>Quick Start Guide</h3>
-                <p>Complete guide to your first VOID Loop in 7 hours</p>
-                <a href="VOID_Quick_Start_Guide.pdf" class="download-btn">Download PDF</a>
-            </div>
-        </div>
+        <div class="template-list">""" + pdf_index_cards(sources) + """</div>
         
         <div style="text-align: center; margin-top: 40px; color: #666;">
             <p>Generated by VoidSEO • <strong>voidseo.dev</strong></p>
@@ -401,6 +826,9 @@ def create_pdf_index(output_dir):
     </html>
     """
     
+    if minify:
+        index_html = minify_html(index_html)
+    
     index_path = output_dir / "index.html"
     with open(index_path, 'w', encoding='utf-8') as f:
         f.write(index_html)
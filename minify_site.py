@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Site Minifier
+Strips whitespace and comments from the site's static HTML pages
+"""
+
+import argparse
+import functools
+import os
+import shutil
+from pathlib import Path
+
+from build_manifest import BuildManifest, code_digest, file_digest
+from template_compress import remove_stale_compressed
+from template_minify import minify_html
+
+# Kept apart from the generators' manifest, whose entries for the same page
+# names describe the unminified output
+MANIFEST_NAME = ".minify-manifest.json"
+
+# Directories never searched for pages (build output, dependencies)
+SKIP_DIRS = frozenset(['dist', 'out', 'node_modules', '__pycache__'])
+
+# Files the pages reference, copied unchanged into the mirror so it can be deployed
+ASSET_SUFFIXES = frozenset(['.css', '.js', '.svg', '.png', '.jpg', '.jpeg', '.gif', '.webp', '.avif', '.ico',
+                            '.woff', '.woff2', '.ttf', '.pdf', '.zip', '.xml', '.txt', '.webmanifest'])
+ASSET_NAMES = frozenset(['CNAME'])
+
+# Server-side and tooling code that is not part of the static site
+ASSET_SKIP_DIRS = frozenset(['benchmarks', 'lib', 'scripts', 'supabase'])
+ASSET_SKIP_NAMES = frozenset(['middleware.js', 'next.config.js'])
+
+def iter_site_pages(base_dir, output_dir=None):
+    """Yield every .html page under base_dir, skipping hidden, dependency and output directories"""
+    excluded = Path(output_dir).resolve() if output_dir else None
+    for directory, subdirs, files in os.walk(base_dir):
+        subdirs[:] = sorted(name for name in subdirs
+                            if not name.startswith('.') and name not in SKIP_DIRS
+                            and (Path(directory) / name).resolve() != excluded)
+        for name in sorted(files):
+            if name.endswith('.html'):
+                yield Path(directory) / name
+
+def iter_site_assets(base_dir, output_dir=None):
+    """Yield every static asset under base_dir that the mirror needs besides the pages"""
+    excluded = Path(output_dir).resolve() if output_dir else None
+    for directory, subdirs, files in os.walk(base_dir):
+        subdirs[:] = sorted(name for name in subdirs
+                            if not name.startswith('.') and name not in SKIP_DIRS | ASSET_SKIP_DIRS
+                            and (Path(directory) / name).resolve() != excluded)
+        for name in sorted(files):
+            if name in ASSET_SKIP_NAMES or name.startswith('.'):
+                continue
+            if name in ASSET_NAMES or Path(name).suffix.lower() in ASSET_SUFFIXES:
+                yield Path(directory) / name
+
+def copy_asset(source_path, output_path, force=False):
+    """Copy an asset unless the copy already has its size and modification time
+
+    Returns True if the file was copied, False if it was skipped.
+    """
+    source = os.stat(source_path)
+    try:
+        copy = os.stat(output_path)
+    except FileNotFoundError:
+        copy = None
+    if not force and copy is not None and (copy.st_size, copy.st_mtime_ns) == (source.st_size, source.st_mtime_ns):
+        return False
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source_path, output_path)
+    return True
+
+@functools.lru_cache(maxsize=None)
+def minifier_digest():
+    """Return the digest of the minifier code, part of every page's fingerprint"""
+    return code_digest(Path(__file__).with_name("template_minify.py"))
+
+def minify_page(source_path, output_path, manifest, force=False):
+    """Minify one page into output_path unless it is up to date
+
+    Returns True if the page was written, False if it was skipped. manifest
+    is the output directory's minify manifest; it records the content each
+    page was minified from (in place, the minified content itself) and is
+    saved by the caller.
+    """
+
+    source_path = Path(source_path)
+    output_path = Path(output_path)
+    fingerprint = {'source': file_digest(source_path), 'code': minifier_digest()}
+    if not force and manifest.is_fresh(output_path, fingerprint):
+        return False
+
+    with open(source_path, 'r', encoding='utf-8') as f:
+        html = minify_html(f.read())
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(html)
+    os.replace(tmp_path, output_path)
+
+    if output_path.resolve() == source_path.resolve():
+        fingerprint['source'] = file_digest(output_path)
+    manifest.record(output_path, fingerprint)
+    return True
+
+def main(argv=None):
+    """Main function to minify the static site pages"""
+
+    parser = argparse.ArgumentParser(description="Minify VoidSEO static HTML pages")
+    parser.add_argument('paths', nargs='*', type=Path,
+                        help="pages to minify (default: every .html page of the site)")
+    parser.add_argument('--output', '-o', type=Path, default=None, metavar='DIR',
+                        help="write minified copies under DIR, mirroring the site layout together with its "
+                             "assets (default: dist)")
+    parser.add_argument('--in-place', action='store_true', help="overwrite the pages themselves")
+    parser.add_argument('--force', action='store_true', help="minify every page even if unchanged")
+    args = parser.parse_args(argv)
+
+    # Setup paths
+    base_dir = Path(__file__).parent
+    output_dir = None if args.in_place else (args.output or base_dir / "dist")
+    pages = args.paths or sorted(iter_site_pages(base_dir, output_dir))
+
+    print("🚀 Minifying VoidSEO Site Pages...")
+    print("=" * 50)
+
+    manifests = {}
+    written = []
+    skipped_count = 0
+    original_bytes = 0
+    minified_bytes = 0
+
+    for page in pages:
+        if not page.exists():
+            print(f"⚠️  File not found: {page}")
+            continue
+        relative = Path(os.path.relpath(page.resolve(), base_dir.resolve()))
+        output_path = page if output_dir is None else output_dir / relative
+        # One manifest per output directory, saved once every page is done
+        manifest = manifests.get(output_path.parent)
+        if manifest is None:
+            manifest = manifests[output_path.parent] = BuildManifest(output_path.parent, MANIFEST_NAME)
+        try:
+            before = page.stat().st_size
+            if minify_page(page, output_path, manifest, force=args.force):
+                written.append(output_path)
+                original_bytes += before
+                minified_bytes += output_path.stat().st_size
+            else:
+                skipped_count += 1
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"❌ Error minifying {page}: {e}")
+
+    for manifest in manifests.values():
+        manifest.save()
+
+    # Compressed siblings of rewritten pages no longer match them
+    remove_stale_compressed(written)
+
+    # A full mirror also needs the stylesheets, scripts, images and downloads
+    copied_count = 0
+    if output_dir is not None and not args.paths:
+        for asset in iter_site_assets(base_dir, output_dir):
+            try:
+                if copy_asset(asset, output_dir / asset.relative_to(base_dir), force=args.force):
+                    copied_count += 1
+            except OSError as e:
+                print(f"❌ Error copying {asset}: {e}")
+
+    print("=" * 50)
+    print(f"✨ Minified {len(written)} pages ({skipped_count} up to date)")
+    if copied_count:
+        print(f"📋 Copied {copied_count} assets")
+    if original_bytes:
+        saved = 100 * (original_bytes - minified_bytes) / original_bytes
+        print(f"📉 {original_bytes:,} → {minified_bytes:,} bytes ({saved:.0f}% smaller)")
+    if output_dir is not None:
+        print(f"📁 Output directory: {output_dir}")
+
+if __name__ == "__main__":
+    main()
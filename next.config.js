@@ -43,6 +43,16 @@ const nextConfig = {
           }
         ]
       }] : []),
+      {
+        // Template stylesheets are named by content hash, so they never change
+        source: '/templates/html/:stylesheet(voidseo\\.[0-9a-f]{12}\\.css)',
+        headers: [
+          {
+            key: 'Cache-Control',
+            value: 'public, max-age=31536000, immutable'
+          }
+        ]
+      },
       {
         // CSP for enhanced security
         source: '/(.*)',
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Template Personalizer
+Builds pre-filled copies of the HTML templates from a CSV or JSONL file of records
+"""
+
+import argparse
+import csv
+import functools
+import html
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+from create_html_templates import get_template_info, template_head_tags, wrap_html_document
+from template_index import discover_templates, parse_front_matter, split_front_matter
+from template_markdown import FILL_CLASS, FILL_FIELDS, build_converter
+from template_minify import minify_html
+
+# Record keys (CSV columns or JSONL object keys) -> meta field label they fill
+RECORD_FIELDS = {
+    'project': 'Project/Module name:',
+    'author': 'Author / Team:',
+    'date': 'Date:',
+    'owner': 'Owner:',
+}
+
+# Record key naming the output directory of a copy (default: the record number)
+RECORD_ID = 'id'
+
+# Private-use markers compiled into the fill areas so the slots can be found in the page
+_SLOT_START = '\ue000'
+_SLOT_END = '\ue001'
+_SLOT_LABELS = tuple(FILL_FIELDS)
+_SLOT_RE = re.compile(rf'\s*<div class="{FILL_CLASS}">\s*<p>{_SLOT_START}(\d+){_SLOT_END}</p>\s*</div>')
+_UNSAFE_ID_RE = re.compile(r'[^A-Za-z0-9._-]+')
+
+class SlotTemplate:
+    """A page compiled into static byte chunks around its meta-field slots
+
+    chunks[i] precedes slot i and the last chunk follows the final slot.
+    A slot without a value keeps the page's usual fill area.
+    """
+
+    def __init__(self, chunks, slots, defaults):
+        self.chunks = chunks
+        self.slots = slots
+        self.defaults = defaults
+
+    def render(self, values):
+        """Return the page bytes with each slot's label looked up in values (pre-escaped bytes)"""
+        parts = [self.chunks[0]]
+        for index, label in enumerate(self.slots):
+            parts.append(values.get(label) or self.defaults[index])
+            parts.append(self.chunks[index + 1])
+        return b''.join(parts)
+
+def slot_converter():
+    """Return a new converter whose meta-field fill areas hold slot markers instead of hints"""
+    return build_converter({label: f"{_SLOT_START}{index}{_SLOT_END}" for index, label in enumerate(_SLOT_LABELS)})
+
+def split_slots(page):
+    """Split a page whose body came from slot_converter() into a SlotTemplate"""
+
+    # Static chunks are encoded once; unfilled slots fall back to the usual hint
+    chunks = []
+    slots = []
+    defaults = []
+    start = 0
+    for match in _SLOT_RE.finditer(page):
+        label = _SLOT_LABELS[int(match.group(1))]
+        hint = html.escape(FILL_FIELDS[label], quote=False)
+        chunks.append(page[start:match.start()].encode('utf-8'))
+        slots.append(label)
+        marker = f"{_SLOT_START}{match.group(1)}{_SLOT_END}"
+        defaults.append(match.group(0).replace(marker, hint).encode('utf-8'))
+        start = match.end()
+    chunks.append(page[start:].encode('utf-8'))
+    return SlotTemplate(chunks, slots, defaults)
+
+def compile_template(md_file_path, minify=False):
+    """Convert a template once and split the finished page at its meta-field slots"""
+
+    with open(md_file_path, 'r', encoding='utf-8') as f:
+        front_matter, md_content = split_front_matter(f.read())
+    metadata = parse_front_matter(front_matter)
+    template_name, template_description = get_template_info(md_file_path, metadata)
+    head_tags = template_head_tags(md_file_path, metadata)
+    page = wrap_html_document(slot_converter().convert(md_content), template_name, template_description,
+                              head_tags=head_tags)
+    if minify:
+        page = minify_html(page)
+    return split_slots(page)
+
+def iter_records(path):
+    """Yield each record of a CSV file (header row) or a JSONL file as a dict"""
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.suffix.lower() in ('.jsonl', '.ndjson'):
+            for number, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        record = json.loads(line)
+                    except ValueError as e:
+                        raise ValueError(f"{path}:{number}: {e}") from None
+                    if not isinstance(record, dict):
+                        raise ValueError(f"{path}:{number}: expected a JSON object")
+                    yield record
+        else:
+            yield from csv.DictReader(f)
+
+@functools.lru_cache(maxsize=4096)
+def slot_value(value):
+    """Return the escaped UTF-8 bytes a value fills its slot with (dates and teams repeat a lot)"""
+    return (' ' + html.escape(value, quote=False)).encode('utf-8')
+
+def record_values(record):
+    """Return {label: slot bytes} for the fields a record fills"""
+    values = {}
+    for key, value in record.items():
+        label = RECORD_FIELDS.get(str(key).strip().lower())
+        if label is not None and value is not None and str(value).strip():
+            values[label] = slot_value(str(value).strip())
+    return values
+
+def record_directory(record, number):
+    """Return a safe directory name for a record, falling back to its number"""
+    name = _UNSAFE_ID_RE.sub('-', str(record.get(RECORD_ID) or '')).strip('.-')
+    return name or str(number)
+
+def personalize(records, templates, output_dir):
+    """Write one copy of every compiled template per record, returning (copies, files written)"""
+
+    # Plain string paths: pathlib overhead is noticeable at 100,000 copies
+    output_dir = os.fspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = [(f"{stem}.html", template) for stem, template in templates.items()]
+    seen = set()
+    copies = 0
+    written = 0
+    for number, record in enumerate(records, 1):
+        name = record_directory(record, number)
+        if name in seen:
+            print(f"⚠️  Duplicate record id {name!r} (record {number}), skipped")
+            continue
+        seen.add(name)
+
+        values = record_values(record)
+        directory = os.path.join(output_dir, name)
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        for file_name, template in outputs:
+            with open(os.path.join(directory, file_name), 'wb') as f:
+                f.write(template.render(values))
+            written += 1
+        copies += 1
+    return copies, written
+
+def main(argv=None):
+    """Main function to build personalized template copies"""
+
+    parser = argparse.ArgumentParser(description="Build pre-filled copies of the VoidSEO HTML templates")
+    parser.add_argument('records', type=Path,
+                        help="CSV (with a header row) or JSONL file of records; keys: "
+                             f"{RECORD_ID}, " + ', '.join(RECORD_FIELDS))
+    parser.add_argument('--output', '-o', type=Path, default=None, metavar='DIR',
+                        help="write each record's copies to DIR/<id>/ (default: dist/personalized)")
+    parser.add_argument('--template', '-t', action='append', default=None, metavar='STEM',
+                        help="only personalize this template, e.g. VOID_Vision_Template (repeatable)")
+    parser.add_argument('--minify', action='store_true', help="strip whitespace and comments from the copies")
+    args = parser.parse_args(argv)
+
+    # Setup paths
+    base_dir = Path(__file__).parent
+    output_dir = args.output or base_dir / "dist" / "personalized"
+
+    print("🚀 Personalizing VoidSEO HTML Templates...")
+    print("=" * 50)
+
+    sources = [source for source in discover_templates(base_dir)
+               if args.template is None or source.path.stem in args.template]
+    if not sources:
+        print("❌ No matching templates found")
+        return 1
+
+    # Compile each template once; every copy is then a join of its chunks
+    started = time.perf_counter()
+    templates = {}
+    for source in sources:
+        template = compile_template(source.path, minify=args.minify)
+        templates[source.path.stem] = template
+        print(f"🧩 Compiled: {source.path.name} ({len(template.slots)} slots)")
+    compiled = time.perf_counter()
+
+    try:
+        copies, written = personalize(iter_records(args.records), templates, output_dir)
+    except (OSError, ValueError, csv.Error) as e:
+        print(f"❌ Error personalizing from {args.records}: {e}")
+        return 1
+    finished = time.perf_counter()
+
+    print("=" * 50)
+    print(f"✨ Wrote {written:,} pages for {copies:,} records")
+    print(f"⏱️  Compiled in {(compiled - started) * 1000:.0f} ms, "
+          f"wrote in {finished - compiled:.2f} s ({written / max(finished - compiled, 1e-9):,.0f} pages/s)")
+    print(f"📁 Output directory: {output_dir}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
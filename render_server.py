@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Render Server
+Long-running local service that renders personalized template pages and PDFs on demand
+
+Usage:
+    python render_server.py                       # http://127.0.0.1:8765
+    python render_server.py --socket /tmp/voidseo.sock
+
+    GET /templates/VOID_Vision_Template.html?project=Acme&date=2026-10-17
+    GET /templates/VOID_Vision_Template.pdf?owner=Ana
+    GET /stats                                    # cache counters and latency percentiles
+
+Templates are compiled once per source version into slot templates (see
+personalize_templates.py) and the WeasyPrint render context stays warm, so a
+request costs a join and, for PDFs, one layout. Rendered bodies are kept in
+an LRU cache keyed by content hash, and concurrent requests for the same body
+share one render. Requests for one template with different field values
+share only its compiled slot template: each still gets its own join and
+layout, and PDF layouts run one at a time in the render thread.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+from build_manifest import file_digest, text_digest
+from generate_pdf_templates import get_render_context, wrap_pdf_document
+from personalize_templates import RECORD_FIELDS, compile_template, record_values, slot_converter, split_slots
+from template_index import discover_templates, parse_front_matter, split_front_matter, template_source
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_MB = 64
+
+# Requests kept per format for the latency percentiles
+LATENCY_WINDOW = 10000
+PERCENTILES = (50, 90, 99)
+
+CONTENT_TYPES = {
+    'html': 'text/html; charset=utf-8',
+    'pdf': 'application/pdf',
+}
+
+class PdfUnavailableError(RuntimeError):
+    """WeasyPrint could not be loaded, so only HTML can be served"""
+
+class RenderCache:
+    """LRU cache of rendered bodies that renders each key once, however many requests want it
+
+    Only requests for the same key, i.e. the same template version, format
+    and field values, are coalesced; renders for different keys are not
+    batched together.
+    """
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def get(self, key, render):
+        """Return (body, outcome) for key, calling render() unless another request already is
+
+        outcome is 'hit', 'miss' (this call rendered) or 'coalesced' (it
+        waited for the render another request had started).
+        """
+        with self.lock:
+            body = self.entries.get(key)
+            if body is not None:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return body, 'hit'
+            future = self.pending.get(key)
+            owner = future is None
+            if owner:
+                future = self.pending[key] = Future()
+                self.misses += 1
+            else:
+                self.coalesced += 1
+
+        if not owner:
+            return future.result(), 'coalesced'
+
+        try:
+            body = render()
+        except BaseException as e:
+            with self.lock:
+                del self.pending[key]
+            future.set_exception(e)
+            raise
+        with self.lock:
+            del self.pending[key]
+            self._store(key, body)
+        future.set_result(body)
+        return body, 'miss'
+
+    def _store(self, key, body):
+        """Insert a body, evicting least recently used entries beyond max_bytes"""
+        if len(body) > self.max_bytes:
+            return
+        self.entries[key] = body
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, evicted = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+
+    def stats(self):
+        """Return the cache counters"""
+        with self.lock:
+            return {'entries': len(self.entries), 'bytes': self.size, 'hits': self.hits,
+                    'misses': self.misses, 'coalesced': self.coalesced}
+
+class LatencyRecorder:
+    """Sliding window of request latencies per format"""
+
+    def __init__(self, window=LATENCY_WINDOW):
+        self.samples = {}
+        self.window = window
+        self.lock = threading.Lock()
+
+    def record(self, kind, seconds):
+        with self.lock:
+            self.samples.setdefault(kind, deque(maxlen=self.window)).append(seconds)
+
+    def percentiles(self):
+        """Return {kind: {'count', 'p50_ms', ...}} using the nearest-rank method"""
+        with self.lock:
+            snapshot = {kind: sorted(samples) for kind, samples in self.samples.items()}
+        report = {}
+        for kind, ordered in snapshot.items():
+            stats = {'count': len(ordered)}
+            for percentile in PERCENTILES:
+                index = max(0, -(-percentile * len(ordered) // 100) - 1)
+                stats[f'p{percentile}_ms'] = round(ordered[index] * 1000, 2)
+            report[kind] = stats
+        return report
+
+def compile_pdf_template(md_file_path):
+    """Convert a template once into its print document, split at the meta-field slots"""
+    with open(md_file_path, 'r', encoding='utf-8') as f:
+        front_matter, md_content = split_front_matter(f.read())
+    template_name = template_source(md_file_path, parse_front_matter(front_matter)).name
+    return split_slots(wrap_pdf_document(slot_converter().convert(md_content), template_name))
+
+class TemplateRenderer:
+    """Compiled templates, the warm PDF render thread and the rendered-body cache"""
+
+    def __init__(self, base_dir, cache_bytes, minify=False):
+        self.base_dir = Path(base_dir)
+        self.minify = minify
+        self.cache = RenderCache(cache_bytes)
+        self.latency = LatencyRecorder()
+        self.sources = {}
+        self.compiled = {}
+        self.lock = threading.Lock()
+        # WeasyPrint is not thread-safe; one thread owns the render context
+        self.layout = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-layout')
+        self.pdf_error = None
+
+    def refresh_sources(self):
+        """Re-discover templates, e.g. after one was added"""
+        sources = {source.path.stem: source.path for source in discover_templates(self.base_dir)}
+        with self.lock:
+            self.sources = sources
+        return sources
+
+    def source_path(self, stem):
+        """Return the source of a template stem, or None"""
+        path = self.sources.get(stem)
+        if path is None or not path.exists():
+            path = self.refresh_sources().get(stem)
+        return path
+
+    def warm_up(self):
+        """Compile every template and load fonts and stylesheet before the first request
+
+        If WeasyPrint (or Pango) cannot be loaded, HTML is still served and PDF
+        requests get the error.
+        """
+        for stem, path in self.refresh_sources().items():
+            source_hash = file_digest(path)
+            for kind in CONTENT_TYPES:
+                self.slot_template(kind, stem, path, source_hash)
+        try:
+            self.layout.submit(get_render_context).result()
+        except Exception as e:
+            self.pdf_error = str(e) or type(e).__name__
+
+    def slot_template(self, kind, stem, path, source_hash):
+        """Return the compiled slot template of a source version, compiling it on first use"""
+        key = (kind, stem, source_hash)
+        template = self.compiled.get(key)
+        if template is None:
+            template = compile_template(path, self.minify) if kind == 'html' else compile_pdf_template(path)
+            with self.lock:
+                # Drop versions compiled from older sources
+                for old_key in [old for old in self.compiled if old[:2] == key[:2]]:
+                    del self.compiled[old_key]
+                self.compiled[key] = template
+        return template
+
+    def render(self, kind, stem, fields):
+        """Return (body, cache outcome) for a template personalized with fields"""
+        if kind == 'pdf' and self.pdf_error is not None:
+            raise PdfUnavailableError(f"PDF rendering unavailable: {self.pdf_error}")
+        path = self.source_path(stem)
+        if path is None:
+            raise KeyError(stem)
+        source_hash = file_digest(path)
+        values = record_values(fields)
+        key = text_digest(json.dumps([kind, self.minify, source_hash, sorted(values.items())],
+                                     default=bytes.hex))
+
+        def render_body():
+            template = self.slot_template(kind, stem, path, source_hash)
+            page = template.render(values)
+            if kind == 'html':
+                return page
+            return self.layout.submit(self.layout_pdf, page.decode('utf-8'), path).result()
+
+        return self.cache.get(key, render_body)
+
+    def layout_pdf(self, document_html, md_file_path):
+        """Lay out a filled print document in the render thread, as layout_pdf_document() does"""
+        context = get_render_context()
+        document = context.render(document_html, base_url=str(Path(md_file_path).resolve().parent))
+        return document.write_pdf()
+
+    def stats(self):
+        return {'cache': self.cache.stats(), 'latency': self.latency.percentiles(),
+                'compiled_templates': len(self.compiled)}
+
+class RenderRequestHandler(BaseHTTPRequestHandler):
+    """GET /templates/<stem>.html|.pdf?field=value and GET /stats"""
+
+    server_version = "VoidSEORender/1"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        if url.path == '/stats':
+            self.send_body(200, json.dumps(self.server.renderer.stats(), indent=2).encode('utf-8'),
+                           'application/json')
+            return
+
+        stem, _, kind = url.path.removeprefix('/templates/').rpartition('.')
+        if not url.path.startswith('/templates/') or kind not in CONTENT_TYPES or not stem:
+            self.send_error_text(404, "Use /templates/<template>.html, /templates/<template>.pdf or /stats")
+            return
+
+        fields = dict(parse_qsl(url.query))
+        unknown = sorted(set(fields) - set(RECORD_FIELDS))
+        if unknown:
+            self.send_error_text(400, f"Unknown fields: {', '.join(unknown)} (use {', '.join(RECORD_FIELDS)})")
+            return
+
+        try:
+            body, outcome = self.server.renderer.render(kind, stem, fields)
+        except KeyError:
+            self.send_error_text(404, f"No template named {stem}")
+            return
+        except PdfUnavailableError as e:
+            self.send_error_text(503, str(e))
+            return
+        except Exception as e:
+            self.send_error_text(500, f"Error rendering {stem}.{kind}: {e}")
+            return
+
+        self.send_body(200, body, CONTENT_TYPES[kind], {'X-Render-Cache': outcome})
+        self.server.renderer.latency.record(kind, time.perf_counter() - started)
+
+    def send_body(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_text(self, status, message):
+        self.send_body(status, (message + '\n').encode('utf-8'), 'text/plain; charset=utf-8')
+
+    def address_string(self):
+        # Unix socket peers have no (host, port) address
+        return self.client_address[0] if isinstance(self.client_address, tuple) else 'unix'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+class ThreadingUnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """HTTP over a Unix socket, one thread per connection"""
+    daemon_threads = True
+
+def make_server(renderer, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None, verbose=False):
+    """Create the HTTP server, listening on host:port or on a Unix socket"""
+    if socket_path is not None:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = ThreadingUnixHTTPServer(str(socket_path), RenderRequestHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+        server.daemon_threads = True
+    server.renderer = renderer
+    server.verbose = verbose
+    return server
+
+def print_stats(stats):
+    """Print the cache counters and latency percentiles"""
+    cache = stats['cache']
+    print(f"🗃️  Cache: {cache['hits']} hits, {cache['misses']} renders, {cache['coalesced']} coalesced, "
+          f"{cache['entries']} entries ({cache['bytes'] / (1024 * 1024):.1f} MiB)")
+    for kind, latency in sorted(stats['latency'].items()):
+        print(f"⏱️  {kind}: {latency['count']} requests, " +
+              ', '.join(f"p{percentile} {latency[f'p{percentile}_ms']:.1f} ms" for percentile in PERCENTILES))
+
+def main(argv=None):
+    """Main function to run the render server"""
+
+    parser = argparse.ArgumentParser(description="Serve personalized VoidSEO template pages and PDFs")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"address to listen on (default {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"port to listen on (default {DEFAULT_PORT})")
+    parser.add_argument('--socket', type=Path, metavar='PATH', help="listen on a Unix socket instead of TCP")
+    parser.add_argument('--cache-mb', type=float, default=DEFAULT_CACHE_MB, metavar='MB',
+                        help=f"memory for rendered bodies (default {DEFAULT_CACHE_MB})")
+    parser.add_argument('--minify', action='store_true', help="serve minified HTML pages")
+    parser.add_argument('--verbose', '-v', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    base_dir = Path(__file__).parent
+    renderer = TemplateRenderer(base_dir, int(args.cache_mb * 1024 * 1024), minify=args.minify)
+
+    print("🚀 Starting VoidSEO Render Server...")
+    print("=" * 50)
+
+    started = time.perf_counter()
+    try:
+        renderer.warm_up()
+    except Exception as e:
+        print(f"❌ Error warming up: {e}")
+        return 1
+    print(f"🔥 Warmed up {len(renderer.sources)} templates in {(time.perf_counter() - started) * 1000:.0f} ms")
+    if renderer.pdf_error is not None:
+        print(f"⚠️  PDF rendering unavailable, serving HTML only: {renderer.pdf_error}")
+
+    server = make_server(renderer, args.host, args.port, args.socket, args.verbose)
+    where = args.socket if args.socket else f"http://{args.host}:{server.server_address[1]}"
+    print(f"📡 Listening on {where} (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping")
+    finally:
+        server.server_close()
+        renderer.layout.shutdown()
+        if args.socket and args.socket.exists():
+            args.socket.unlink()
+
+    print("=" * 50)
+    print_stats(renderer.stats())
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+VoidSEO SEO Audit
+Offline audit of the generated and static site pages: broken internal
+links, orphan pages, duplicate titles and missing meta tags
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections import defaultdict, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+
+from minify_site import iter_site_pages
+from template_sitemap import SITE_URL
+
+# Fields kept in the inverted index
+INDEX_FIELDS = ('title', 'description', 'canonical', 'h1')
+
+# Link schemes that never point at a page of the site
+EXTERNAL_SCHEMES = ('mailto:', 'tel:', 'javascript:', 'data:', '#')
+
+PageInfo = namedtuple('PageInfo', ['url', 'path', 'title', 'description', 'canonical', 'robots',
+                                   'h1', 'links', 'error'])
+
+class PageParser(HTMLParser):
+    """Collect the head tags, first heading and link targets of one page"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = None
+        self.description = None
+        self.canonical = None
+        self.robots = None
+        self.h1 = None
+        self.links = []
+        self._capture = None
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'meta':
+            name = (attrs.get('name') or '').lower()
+            if name == 'description':
+                self.description = (attrs.get('content') or '').strip()
+            elif name == 'robots':
+                self.robots = (attrs.get('content') or '').strip().lower()
+        elif tag == 'link' and 'canonical' in (attrs.get('rel') or '').lower().split():
+            self.canonical = (attrs.get('href') or '').strip()
+        elif tag in ('a', 'area') and attrs.get('href'):
+            self.links.append(attrs['href'].strip())
+        elif tag in ('title', 'h1') and self._capture is None:
+            self._capture = tag
+            self._text = []
+
+    def handle_endtag(self, tag):
+        if tag != self._capture:
+            return
+        text = ' '.join(''.join(self._text).split())
+        if tag == 'title':
+            self.title = self.title or text
+        else:
+            self.h1 = self.h1 or text
+        self._capture = None
+
+    def handle_data(self, data):
+        if self._capture is not None:
+            self._text.append(data)
+
+def page_url(relative_path):
+    """Return the site path a page is served at, e.g. docs/index.html -> /docs/"""
+    url = '/' + Path(relative_path).as_posix()
+    return url[:-len('index.html')] if url.endswith('/index.html') else url
+
+def resolve_link(page, href):
+    """Return the site path an internal link points at, or None for external links"""
+    if href.lower().startswith(EXTERNAL_SCHEMES):
+        return None
+    target = urlsplit(urljoin(SITE_URL + page, href))
+    if f"{target.scheme}://{target.netloc}" != SITE_URL:
+        return None
+    return unquote(target.path) or '/'
+
+def parse_page(path, relative_path):
+    """Process pool entry point: parse one page into a PageInfo"""
+    url = page_url(relative_path)
+    parser = PageParser()
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            parser.feed(f.read())
+        parser.close()
+        error = None
+    except (OSError, UnicodeDecodeError) as e:
+        error = str(e)
+
+    links = sorted({link for link in (resolve_link(url, href) for href in parser.links) if link})
+    return PageInfo(url, relative_path, parser.title, parser.description, parser.canonical,
+                    parser.robots, parser.h1, links, error)
+
+def target_exists(base_dir, link):
+    """Check whether a site path maps to a file in the tree"""
+    path = Path(base_dir) / link.lstrip('/')
+    if link.endswith('/'):
+        return (path / 'index.html').exists()
+    return path.is_file() or (path / 'index.html').exists() or path.with_suffix('.html').is_file()
+
+class SiteAudit:
+    """Link graph and inverted index over the parsed pages"""
+
+    def __init__(self, base_dir, pages):
+        self.base_dir = Path(base_dir)
+        self.pages = {page.url: page for page in pages}
+        self.outgoing = {page.url: set(page.links) for page in pages}
+        self.incoming = defaultdict(set)
+        for url, links in self.outgoing.items():
+            for link in links:
+                self.incoming[self.normalize(link)].add(url)
+
+        # field -> value -> pages with that value
+        self.index = {field: defaultdict(list) for field in INDEX_FIELDS}
+        for page in pages:
+            for field in INDEX_FIELDS:
+                value = getattr(page, field)
+                if value:
+                    self.index[field][value].append(page.url)
+
+    def normalize(self, link):
+        """Map a link target onto the URL of the page it serves"""
+        return link[:-len('index.html')] if link.endswith('/index.html') else link
+
+    def indexable(self, page):
+        """Whether search engines may index the page"""
+        return 'noindex' not in (page.robots or '')
+
+    def broken_links(self):
+        """Return (page, link) pairs whose target is not in the tree"""
+        exists = {}
+        broken = []
+        for url in sorted(self.outgoing):
+            for link in sorted(self.outgoing[url]):
+                if link not in exists:
+                    exists[link] = self.normalize(link) in self.pages or target_exists(self.base_dir, link)
+                if not exists[link]:
+                    broken.append((url, link))
+        return broken
+
+    def orphans(self):
+        """Return indexable pages no other page links to"""
+        return sorted(url for url, page in self.pages.items()
+                      if url != '/' and self.indexable(page) and not self.incoming[url] - {url})
+
+    def duplicates(self, field):
+        """Return (value, pages) for values shared by several pages"""
+        return sorted((value, sorted(urls)) for value, urls in self.index[field].items() if len(urls) > 1)
+
+    def missing(self):
+        """Return (page, [missing tags]); noindex pages only need a title"""
+        report = []
+        for url in sorted(self.pages):
+            page = self.pages[url]
+            required = ('title', 'description', 'canonical', 'h1') if self.indexable(page) else ('title',)
+            absent = [field for field in required if not getattr(page, field)]
+            if absent:
+                report.append((url, absent))
+        return report
+
+    def unreadable(self):
+        """Return (page, error) for pages that could not be parsed"""
+        return sorted((page.url, page.error) for page in self.pages.values() if page.error)
+
+def audit_site(base_dir, jobs=None):
+    """Parse every site page in a process pool and return the SiteAudit"""
+    base_dir = Path(base_dir)
+    paths = sorted(iter_site_pages(base_dir))
+    relative_paths = [Path(os.path.relpath(path, base_dir)).as_posix() for path in paths]
+    workers = min(jobs or os.cpu_count() or 1, max(len(paths), 1))
+    chunksize = max(1, len(paths) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pages = list(pool.map(parse_page, map(str, paths), relative_paths, chunksize=chunksize))
+    return SiteAudit(base_dir, pages)
+
+def _section(lines, title, rows, empty="None found."):
+    """Append a report section with a bullet per row"""
+    lines.append(f"## {title} ({len(rows)})")
+    lines.append("")
+    lines.extend(rows or [empty])
+    lines.append("")
+
+def render_report(audit):
+    """Return the audit as a Markdown report"""
+
+    pages = audit.pages.values()
+    indexable = sum(1 for page in pages if audit.indexable(page))
+    links = sum(len(targets) for targets in audit.outgoing.values())
+
+    lines = [
+        "# VoidSEO - SEO Audit",
+        "",
+        "Generated by `python3 seo_audit.py --report SEO-AUDIT.md`; do not edit by hand.",
+        "",
+        f"- **Pages:** {len(audit.pages)} ({indexable} indexable, {len(audit.pages) - indexable} noindex)",
+        f"- **Internal links:** {links}",
+        "",
+    ]
+    _section(lines, "❌ Broken internal links", [f"- `{url}` → `{link}`" for url, link in audit.broken_links()])
+    _section(lines, "🏝️ Orphan pages", [f"- `{url}`" for url in audit.orphans()])
+    for field, title in (('title', "Duplicate titles"), ('description', "Duplicate descriptions"),
+                         ('h1', "Duplicate H1 headings")):
+        _section(lines, f"🔁 {title}",
+                 [f"- \"{value}\": " + ', '.join(f"`{url}`" for url in urls)
+                  for value, urls in audit.duplicates(field)])
+    _section(lines, "⚠️ Missing tags", [f"- `{url}`: " + ', '.join(absent) for url, absent in audit.missing()])
+    _section(lines, "🚫 Noindex pages", [f"- `{url}`" for url in sorted(audit.pages)
+                                        if not audit.indexable(audit.pages[url])])
+    unreadable = audit.unreadable()
+    if unreadable:
+        _section(lines, "💥 Unreadable pages", [f"- `{url}`: {error}" for url, error in unreadable])
+    return '\n'.join(lines).rstrip() + '\n'
+
+def print_summary(audit):
+    """Print one line per check"""
+    print(f"📄 Pages audited: {len(audit.pages)}")
+    print(f"❌ Broken internal links: {len(audit.broken_links())}")
+    print(f"🏝️  Orphan pages: {len(audit.orphans())}")
+    print(f"🔁 Duplicate titles: {len(audit.duplicates('title'))}")
+    print(f"⚠️  Pages missing tags: {len(audit.missing())}")
+
+def main(argv=None):
+    """Main function to audit the site pages"""
+
+    parser = argparse.ArgumentParser(description="Audit the VoidSEO site pages offline")
+    parser.add_argument('--jobs', '-j', type=int, default=0, metavar='N',
+                        help="parse pages in N processes (0 = one per CPU core)")
+    parser.add_argument('--report', type=Path, metavar='PATH',
+                        help="write the full Markdown report to PATH (e.g. SEO-AUDIT.md)")
+    parser.add_argument('--strict', action='store_true', help="exit with status 1 if any link is broken")
+    args = parser.parse_args(argv)
+
+    base_dir = Path(__file__).parent
+
+    print("🔍 Auditing VoidSEO Site Pages...")
+    print("=" * 50)
+
+    started = time.perf_counter()
+    audit = audit_site(base_dir, jobs=args.jobs or None)
+    print_summary(audit)
+
+    if args.report:
+        args.report.write_text(render_report(audit), encoding='utf-8')
+        print(f"📝 Report written to {args.report}")
+
+    print("=" * 50)
+    print(f"⏱️  Audited in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    if args.strict and audit.broken_links():
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+VoidSEO Template Archive
+Writes the downloadable template ZIP reproducibly, reusing the compressed
+data of members that have not changed since the last build
+"""
+
+import os
+import re
+import struct
+import zipfile
+import zlib
+from pathlib import Path
+
+from build_manifest import BuildManifest, code_digest, file_digest
+
+ARCHIVE_NAME = "VOID_Loop_Templates_v1.zip"
+
+# Every member gets the same timestamp (1980-01-01 00:00, the earliest a ZIP
+# can hold) and permissions so identical inputs give identical bytes
+DOS_TIME = 0
+DOS_DATE = (1 << 5) | 1
+EXTERNAL_ATTR = 0o100644 << 16
+
+COMPRESS_LEVEL = 9
+CHUNK_SIZE = 1024 * 1024
+
+# <link rel="stylesheet"> to a file next to the page (--external-css builds)
+_STYLESHEET_LINK_RE = re.compile(r'<link rel="stylesheet" href="([^"/:]+\.css)">')
+
+_VERSION = 20
+_UTF8_FLAG = 0x800
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+_CENTRAL_HEADER = struct.Struct('<4s6H3L5H2L')
+_END_RECORD = struct.Struct('<4s4H2LH')
+
+def linked_stylesheets(html_path):
+    """Return the names of the local stylesheets a page links, e.g. voidseo.<hash>.css"""
+    with open(html_path, 'r', encoding='utf-8') as f:
+        return _STYLESHEET_LINK_RE.findall(f.read())
+
+def archive_members(sources, html_dir=None):
+    """Return (arcname, path) pairs in archive order: markdown sources, HTML pages, then their stylesheets"""
+
+    members = [(source.path.name, source.path) for source in sources if source.path.exists()]
+    if html_dir:
+        stylesheets = []
+        for source in sources:
+            html_path = Path(html_dir) / f"{source.path.stem}.html"
+            if html_path.exists():
+                members.append((f"html/{html_path.name}", html_path))
+                stylesheets.extend(name for name in linked_stylesheets(html_path) if name not in stylesheets)
+        for name in stylesheets:
+            css_path = Path(html_dir) / name
+            if css_path.exists():
+                members.append((f"html/{name}", css_path))
+    return members
+
+def _deflate_member(path, out):
+    """Stream path through raw deflate into out, returning (crc, compressed size, size)"""
+
+    compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    crc = 0
+    size = 0
+    compressed_size = 0
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            data = compressor.compress(chunk)
+            compressed_size += len(data)
+            out.write(data)
+    data = compressor.flush()
+    compressed_size += len(data)
+    out.write(data)
+    return crc, compressed_size, size
+
+def _copy_member(previous, info, out):
+    """Copy a member's compressed bytes from the previous archive into out"""
+
+    previous.seek(info.header_offset)
+    header = _LOCAL_HEADER.unpack(previous.read(_LOCAL_HEADER.size))
+    previous.seek(header[-2] + header[-1], os.SEEK_CUR)
+    remaining = info.compress_size
+    while remaining:
+        data = previous.read(min(CHUNK_SIZE, remaining))
+        if not data:
+            raise zipfile.BadZipFile(f"truncated member {info.filename}")
+        out.write(data)
+        remaining -= len(data)
+    return info.CRC, info.compress_size, info.file_size
+
+def _local_header(name, crc=0, compressed_size=0, size=0):
+    """Return a local file header for a deflated member"""
+    return _LOCAL_HEADER.pack(b'PK\x03\x04', _VERSION, _UTF8_FLAG, zipfile.ZIP_DEFLATED,
+                              DOS_TIME, DOS_DATE, crc, compressed_size, size, len(name), 0) + name
+
+def _central_header(name, offset, crc, compressed_size, size):
+    """Return the central directory record for a member"""
+    return _CENTRAL_HEADER.pack(b'PK\x01\x02', (3 << 8) | _VERSION, _VERSION, _UTF8_FLAG,
+                                zipfile.ZIP_DEFLATED, DOS_TIME, DOS_DATE, crc, compressed_size,
+                                size, len(name), 0, 0, 0, 0, EXTERNAL_ATTR, offset) + name
+
+def _open_previous(archive_path):
+    """Open the previous archive for reuse, returning (file, {name: ZipInfo}) or (None, {})"""
+    try:
+        previous = open(archive_path, 'rb')
+    except OSError:
+        return None, {}
+    try:
+        with zipfile.ZipFile(previous) as archive:
+            infos = {info.filename: info for info in archive.infolist()
+                     if info.compress_type == zipfile.ZIP_DEFLATED}
+    except zipfile.BadZipFile:
+        previous.close()
+        return None, {}
+    return previous, infos
+
+def write_archive(archive_path, members, reuse=None):
+    """Write members in order to archive_path, copying compressed data for names in reuse
+
+    reuse is a set of arcnames whose content matches the previous archive at
+    archive_path. Returns the number of members that were recompressed.
+    """
+
+    archive_path = Path(archive_path)
+    previous, infos = _open_previous(archive_path) if reuse else (None, {})
+    tmp_path = archive_path.with_name(archive_path.name + '.tmp')
+    central = []
+    compressed = 0
+
+    try:
+        with open(tmp_path, 'wb') as out:
+            for arcname, path in members:
+                name = arcname.encode('utf-8')
+                offset = out.tell()
+                out.write(_local_header(name))
+
+                info = infos.get(arcname) if arcname in (reuse or ()) else None
+                if info is not None:
+                    crc, compressed_size, size = _copy_member(previous, info, out)
+                else:
+                    crc, compressed_size, size = _deflate_member(path, out)
+                    compressed += 1
+
+                # Sizes are only known once the data is written; patch them in
+                end = out.tell()
+                out.seek(offset)
+                out.write(_local_header(name, crc, compressed_size, size))
+                out.seek(end)
+                central.append(_central_header(name, offset, crc, compressed_size, size))
+
+            directory_offset = out.tell()
+            for record in central:
+                out.write(record)
+            out.write(_END_RECORD.pack(b'PK\x05\x06', 0, 0, len(central), len(central),
+                                       out.tell() - directory_offset, directory_offset, 0))
+    finally:
+        if previous is not None:
+            previous.close()
+
+    os.replace(tmp_path, archive_path)
+    return compressed
+
+def build_archive(archive_path, members, force=False):
+    """Rebuild the template archive if any member changed
+
+    Members whose content digest matches the last build are copied from the
+    existing archive without recompressing. Returns True on success.
+    """
+
+    archive_path = Path(archive_path)
+    manifest = BuildManifest(archive_path.parent)
+
+    try:
+        digests = {arcname: file_digest(path) for arcname, path in members}
+    except OSError as e:
+        print(f"❌ Error reading archive member: {e}")
+        return False
+    fingerprint = {
+        'members': [[arcname, digests[arcname]] for arcname, _ in members],
+        'code': code_digest(__file__),
+    }
+
+    if not force and manifest.is_fresh(archive_path, fingerprint):
+        print(f"⏭️  Up to date: {archive_path}")
+        return True
+
+    # Only trust the previous archive's data if it was written by this code
+    previous = manifest.fingerprint(archive_path)
+    reuse = set()
+    if not force and previous and previous.get('code') == fingerprint['code'] and archive_path.exists():
+        reuse = {arcname for arcname, digest in previous.get('members', [])
+                 if digests.get(arcname) == digest}
+
+    try:
+        compressed = write_archive(archive_path, members, reuse)
+    except (OSError, zipfile.BadZipFile) as e:
+        manifest.forget(archive_path)
+        manifest.save()
+        print(f"❌ Error generating {archive_path}: {e}")
+        return False
+
+    manifest.record(archive_path, fingerprint)
+    manifest.save()
+    print(f"📦 Archived {len(members)} files ({compressed} recompressed): {archive_path}")
+    return True
@@ -0,0 +1,145 @@
+"""
+VoidSEO Template Precompression
+Writes .gz and .br siblings of generated pages so static hosting can serve
+them without compressing at the edge
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; only .gz siblings are written without it
+    brotli = None
+
+from build_manifest import BuildManifest, file_digest
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+# Every sibling suffix precompress() may have written, brotli installed or not
+COMPRESSED_SUFFIXES = ('.gz', '.br')
+
+def _gzip(data):
+    """Gzip at maximum level with a zero timestamp so output is reproducible"""
+    return gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+
+def _brotli(data):
+    """Brotli at maximum quality, tuned for text"""
+    return brotli.compress(data, mode=brotli.MODE_TEXT, quality=BROTLI_QUALITY)
+
+def encoders():
+    """Return (suffix, compress function) for every available encoding"""
+    available = [('.gz', _gzip)]
+    if brotli is not None:
+        available.append(('.br', _brotli))
+    return available
+
+def compress_file(path, suffix, compress):
+    """Write path's compressed sibling atomically and return its size"""
+    path = Path(path)
+    with open(path, 'rb') as f:
+        data = compress(f.read())
+    sibling = path.with_name(path.name + suffix)
+    tmp_path = sibling.with_name(sibling.name + '.tmp')
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, sibling)
+    return len(data)
+
+def remove_compressed(path):
+    """Delete the compressed siblings of a removed file and drop them from the manifest"""
+    path = Path(path)
+    manifest = BuildManifest(path.parent)
+    for suffix in COMPRESSED_SUFFIXES:
+        sibling = path.with_name(path.name + suffix)
+        if sibling.exists():
+            os.remove(sibling)
+        manifest.forget(sibling)
+    manifest.save()
+
+def remove_stale_compressed(paths, suffixes=COMPRESSED_SUFFIXES):
+    """Delete compressed siblings that were not compressed from paths' current content
+
+    Run whenever files are rewritten without precompress(), so a server that
+    prefers .gz or .br never sends an older version. Returns the number of
+    siblings deleted.
+    """
+
+    manifests = {}
+    removed = 0
+    for path in paths:
+        path = Path(path)
+        siblings = [path.with_name(path.name + suffix) for suffix in suffixes]
+        siblings = [sibling for sibling in siblings if sibling.exists()]
+        if not siblings:
+            continue
+        manifest = manifests.get(path.parent)
+        if manifest is None:
+            manifest = manifests[path.parent] = BuildManifest(path.parent)
+        fingerprint = {'source': file_digest(path)}
+        for sibling in siblings:
+            if not manifest.is_fresh(sibling, fingerprint):
+                os.remove(sibling)
+                manifest.forget(sibling)
+                removed += 1
+
+    for manifest in manifests.values():
+        manifest.save()
+
+    if removed:
+        print(f"🧹 Removed {removed} stale compressed files")
+    return removed
+
+def precompress(paths, jobs=None, force=False):
+    """Write compressed siblings of paths in parallel, skipping unchanged content
+
+    Each sibling is tracked in its directory's build manifest by the hash
+    of the file it was compressed from. Siblings of an encoding that is not
+    available are removed once stale. Returns the number of siblings written.
+    """
+
+    paths = [Path(path) for path in paths]
+    manifests = {}
+    tasks = []
+    skipped_count = 0
+    for path in paths:
+        manifest = manifests.get(path.parent)
+        if manifest is None:
+            manifest = manifests[path.parent] = BuildManifest(path.parent)
+        fingerprint = {'source': file_digest(path)}
+        for suffix, compress in encoders():
+            sibling = path.with_name(path.name + suffix)
+            if not force and manifest.is_fresh(sibling, fingerprint):
+                skipped_count += 1
+            else:
+                tasks.append((manifest, sibling, fingerprint, (path, suffix, compress)))
+
+    # zlib and brotli release the GIL while compressing, so threads scale
+    from concurrent.futures import ThreadPoolExecutor
+    written = 0
+    with ThreadPoolExecutor(max_workers=jobs or os.cpu_count() or 1) as executor:
+        futures = [executor.submit(compress_file, *args) for _, _, _, args in tasks]
+        for (manifest, sibling, fingerprint, _), future in zip(tasks, futures):
+            try:
+                future.result()
+            except OSError as e:
+                manifest.forget(sibling)
+                print(f"❌ Error compressing {sibling}: {e}")
+                continue
+            manifest.record(sibling, fingerprint)
+            written += 1
+
+    for manifest in manifests.values():
+        manifest.save()
+
+    unavailable = [suffix for suffix in COMPRESSED_SUFFIXES if suffix not in dict(encoders())]
+    if unavailable:
+        remove_stale_compressed(paths, unavailable)
+
+    suffixes = ' + '.join(suffix for suffix, _ in encoders())
+    print(f"🗜️  Precompressed {written} files ({suffixes}, {skipped_count} up to date)")
+    if brotli is None:
+        print("⚠️  brotli not installed, skipping .br output")
+    return written
@@ -0,0 +1,229 @@
+"""
+VoidSEO Template Index
+Discovers VOID_*.md template sources and caches their front-matter metadata
+"""
+
+import fnmatch
+import functools
+import json
+import os
+import re
+from collections import namedtuple
+from pathlib import Path
+
+TEMPLATE_PATTERN = "VOID_*.md"
+INDEX_NAME = ".template-index.json"
+INDEX_VERSION = 1
+DEFAULT_DESCRIPTION = 'VOID Loop methodology template'
+
+# Directories never searched for sources (generated output, dependencies)
+SKIP_DIRS = frozenset(['templates', 'node_modules', '__pycache__'])
+
+FRONT_MATTER_DELIMITER = '---'
+_FRONT_MATTER_RE = re.compile(r'\A---[ \t]*\r?\n(.*?)^---[ \t]*(?:\r?\n|\Z)', re.S | re.M)
+
+TemplateSource = namedtuple('TemplateSource', ['path', 'name', 'description', 'order', 'metadata'],
+                            defaults=(None,))
+
+def split_front_matter(text):
+    """Split text into (front matter source or None, markdown body)"""
+    match = _FRONT_MATTER_RE.match(text)
+    if match is None:
+        return None, text
+    return match.group(1), text[match.end():]
+
+def strip_front_matter(text):
+    """Return text without its leading front-matter block"""
+    return split_front_matter(text)[1]
+
+def skip_front_matter(lines):
+    """Yield lines without a leading front-matter block"""
+    lines = iter(lines)
+    first = next(lines, None)
+    if first is None:
+        return
+    if first.rstrip() != FRONT_MATTER_DELIMITER:
+        yield first
+        yield from lines
+        return
+
+    # Buffer the block so an unterminated one is passed through untouched
+    held = [first]
+    for line in lines:
+        if line.rstrip() == FRONT_MATTER_DELIMITER:
+            break
+        held.append(line)
+    else:
+        yield from held
+        return
+    yield from lines
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml():
+    """Import PyYAML on first use; the cached index usually makes it unnecessary"""
+    try:
+        import yaml
+    except ImportError:  # PyYAML is optional; flat `key: value` front matter still works
+        return None
+    return yaml
+
+def parse_front_matter(source):
+    """Parse front matter into a dict, returning {} when absent or invalid"""
+    if not source:
+        return {}
+    yaml = _load_yaml()
+    if yaml is not None:
+        try:
+            data = yaml.safe_load(source)
+        except yaml.YAMLError:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    # Fallback parser for flat `key: value` pairs
+    data = {}
+    for line in source.splitlines():
+        key, sep, value = line.partition(':')
+        if not sep or not key.strip() or line[:1].isspace():
+            continue
+        value = value.strip().strip('"\'')
+        data[key.strip()] = int(value) if value.isdigit() else value
+    return data
+
+def read_front_matter(path):
+    """Read and parse only the front-matter lines at the top of a file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        if f.readline().rstrip() != FRONT_MATTER_DELIMITER:
+            return {}
+        lines = []
+        for line in f:
+            if line.rstrip() == FRONT_MATTER_DELIMITER:
+                return parse_front_matter(''.join(lines))
+            lines.append(line)
+    return {}
+
+def template_source(path, metadata):
+    """Build a TemplateSource from a path and its front-matter metadata"""
+    path = Path(path)
+    name = metadata.get('title') or path.stem.replace('VOID_', '').replace('_', ' ')
+    description = metadata.get('description') or DEFAULT_DESCRIPTION
+    order = metadata.get('order')
+    return TemplateSource(path, str(name), str(description), order if isinstance(order, (int, float)) else None,
+                          metadata)
+
+def iter_template_entries(root, pattern=TEMPLATE_PATTERN):
+    """Lazily walk root with os.scandir, yielding a DirEntry per template source"""
+
+    pending = [os.fspath(root)]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS:
+                    subdirs.append(entry.path)
+            elif fnmatch.fnmatchcase(entry.name, pattern):
+                yield entry
+
+        # Depth first, in name order
+        pending.extend(sorted(subdirs, reverse=True))
+
+class MetadataIndex:
+    """On-disk cache of template front matter keyed by path, mtime and size"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.path = self.root / INDEX_NAME
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        """Load entries from disk, starting empty if missing or unreadable"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') == INDEX_VERSION:
+            self.entries = data.get('entries', {})
+
+    def key(self, path):
+        """Return the index key for a source path"""
+        return Path(os.path.relpath(path, self.root)).as_posix()
+
+    def lookup(self, entry):
+        """Return metadata for a DirEntry, re-reading the file only if it changed"""
+        key = self.key(entry.path)
+        stat = entry.stat()
+        stamp = [stat.st_mtime_ns, stat.st_size]
+        cached = self.entries.get(key)
+        if cached is not None and cached['stamp'] == stamp:
+            return cached['metadata']
+
+        try:
+            metadata = read_front_matter(entry.path)
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"⚠️  Could not read front matter from {entry.path}: {e}")
+            metadata = {}
+        # Round-trip through JSON so YAML dates and the like are stored as text
+        metadata = json.loads(json.dumps(metadata, default=str))
+        self.entries[key] = {'stamp': stamp, 'metadata': metadata}
+        self.dirty = True
+        return metadata
+
+    def prune(self, seen_keys):
+        """Drop entries for sources that no longer exist"""
+        for key in set(self.entries) - set(seen_keys):
+            del self.entries[key]
+            self.dirty = True
+
+    def save(self):
+        """Atomically write the index if anything changed"""
+        if not self.dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': INDEX_VERSION, 'entries': self.entries}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+def _sort_key(source):
+    """Order sources by front-matter `order`, then by path"""
+    return (source.order is None, source.order or 0, source.path.as_posix())
+
+def discover_templates(root, pattern=TEMPLATE_PATTERN):
+    """Find every template under root and return TemplateSources in build order
+
+    Outputs are written flat by file stem, so a later source whose stem is
+    already taken is reported and skipped.
+    """
+
+    index = MetadataIndex(root)
+    sources = []
+    seen_keys = []
+
+    for entry in iter_template_entries(root, pattern):
+        seen_keys.append(index.key(entry.path))
+        sources.append(template_source(entry.path, index.lookup(entry)))
+
+    index.prune(seen_keys)
+    index.save()
+
+    sources.sort(key=_sort_key)
+    unique = []
+    stems = set()
+    for source in sources:
+        if source.path.stem in stems:
+            print(f"⚠️  Duplicate template name, skipping: {source.path}")
+            continue
+        stems.add(source.path.stem)
+        unique.append(source)
+    return unique
@@ -0,0 +1,200 @@
+"""
+VoidSEO Template Markdown
+Shared Markdown conversion for the HTML and PDF template generators
+"""
+
+import html
+import re
+import threading
+import xml.etree.ElementTree as etree
+
+import markdown
+from markdown.extensions import Extension
+from markdown.preprocessors import Preprocessor
+from markdown.treeprocessors import Treeprocessor
+
+import build_trace
+
+FILL_CLASS = 'fill-section'
+
+# Empty meta fields (`- **Label:** `) that get a fill area, keyed by label
+FILL_FIELDS = {
+    'Project/Module name:': 'Enter your project name here',
+    'Author / Team:': 'Enter author/team name here',
+    'Date:': 'Enter date here',
+    'Owner:': 'Enter owner name here',
+}
+
+# Prompt lines that are replaced by a fill area showing the prompt itself
+FILL_PROMPTS = frozenset([
+    'What’s happening? Where does this come from (GSC, SERP, CRM, support, logs…)?',
+    "What's happening? Where does this come from (GSC, SERP, CRM, support, logs…)?",
+    'State the pattern crisply.',
+    'What makes this worth solving? Impact on biz/users/process?',
+    'Who benefits? Persona / team / use case.',
+    'Short description + why now.',
+])
+
+# Bold paragraph labels rendered as callouts: label -> (css class, icon)
+CALLOUTS = {
+    'Pitfall to avoid:': ('warning', '⚠️'),
+}
+
+CHECKBOX_MARKER = '[ ]'
+CHECKBOX_GLYPH = '☐'
+
+def fill_area_html(hint):
+    """Return the fill area markup for a hint"""
+    return f'<div class="{FILL_CLASS}"><p>{html.escape(hint, quote=False)}</p></div>'
+
+class FillPromptPreprocessor(Preprocessor):
+    """Replace whole prompt lines with stashed fill areas"""
+
+    def run(self, lines):
+        processed_lines = []
+        for line in lines:
+            prompt = line.strip()
+            if prompt in FILL_PROMPTS:
+                placeholder = self.md.htmlStash.store(fill_area_html(prompt))
+                processed_lines.extend(['', placeholder, ''])
+            else:
+                processed_lines.append(line)
+        return processed_lines
+
+class TemplateTreeprocessor(Treeprocessor):
+    """Style fill fields, checkboxes and callouts in one walk over the tree"""
+
+    def __init__(self, md=None, fill_fields=FILL_FIELDS):
+        super().__init__(md)
+        self.fill_fields = fill_fields
+
+    def run(self, root):
+        with build_trace.stage('postprocess'):
+            for parent in root.iter():
+                for index, child in enumerate(parent):
+                    if child.tag == 'li':
+                        self.style_list_item(child)
+                    elif child.tag == 'p':
+                        self.style_callout(parent, index, child)
+
+    def style_list_item(self, item):
+        """Turn `[ ]` items into checkboxes and empty meta fields into fill areas"""
+        target = item[0] if not (item.text or '').strip() and len(item) and item[0].tag == 'p' else item
+        text = target.text or ''
+        if text.startswith(CHECKBOX_MARKER):
+            item.set('class', 'checkbox-item')
+            target.text = CHECKBOX_GLYPH + text[len(CHECKBOX_MARKER):]
+            return
+
+        label = _leading_strong(target)
+        if label is not None and len(target) == 1 and not (label.tail or '').strip():
+            hint = self.fill_fields.get(label.text)
+            if hint is not None:
+                area = etree.SubElement(target, 'div', {'class': FILL_CLASS})
+                etree.SubElement(area, 'p').text = hint
+
+    def style_callout(self, parent, index, paragraph):
+        """Wrap paragraphs that open with a callout label in a styled div"""
+        label = _leading_strong(paragraph)
+        callout = CALLOUTS.get(label.text) if label is not None else None
+        if callout is None:
+            return
+        css_class, icon = callout
+        label.text = f'{icon} {label.text}'
+        wrapper = etree.Element('div', {'class': css_class})
+        wrapper.tail, paragraph.tail = paragraph.tail, None
+        wrapper.append(paragraph)
+        parent[index] = wrapper
+
+def _leading_strong(element):
+    """Return element's first child if it is a <strong> with no text before it"""
+    if (element.text or '').strip() or not len(element) or element[0].tag != 'strong':
+        return None
+    return element[0]
+
+class TemplateExtension(Extension):
+    """Fill areas, checkboxes and callouts for VOID Loop templates"""
+
+    def __init__(self, **kwargs):
+        self.config = {
+            'fill_fields': [FILL_FIELDS, "Hint shown in each meta field's fill area, keyed by label"],
+        }
+        super().__init__(**kwargs)
+
+    def extendMarkdown(self, md):
+        # After fenced code is stashed, before raw HTML blocks are parsed
+        md.preprocessors.register(FillPromptPreprocessor(md), 'void_fill_prompts', 24)
+        # After inline patterns have produced <strong> elements
+        md.treeprocessors.register(TemplateTreeprocessor(md, self.getConfig('fill_fields')), 'void_template', 15)
+
+BASE_EXTENSIONS = ['extra', 'codehilite']
+MARKDOWN_EXTENSIONS = [*BASE_EXTENSIONS, TemplateExtension()]
+
+# One converter per thread; worker processes get their own copy of this module
+_local = threading.local()
+
+def build_converter(fill_fields=None):
+    """Return a new template converter, optionally with other fill-area hints per meta field"""
+    if fill_fields is None:
+        return markdown.Markdown(extensions=MARKDOWN_EXTENSIONS)
+    return markdown.Markdown(extensions=[*BASE_EXTENSIONS, TemplateExtension(fill_fields=fill_fields)])
+
+def get_converter():
+    """Return this thread's Markdown converter, building it on first use"""
+    converter = getattr(_local, 'converter', None)
+    if converter is None:
+        converter = build_converter()
+        _local.converter = converter
+    return converter
+
+def convert_markdown(md_content):
+    """Convert markdown text to HTML, reusing the thread's warm converter"""
+    converter = get_converter()
+    try:
+        return converter.convert(md_content)
+    finally:
+        converter.reset()
+
+# Streaming mode flushes once a chunk holds at least this many characters
+STREAM_CHUNK_SIZE = 256 * 1024
+
+# Lines that continue the previous block (lists, quotes, tables) and so
+# must stay in the same chunk
+_CONTINUATION_RE = re.compile(r'([-*+>|]|\d+[.)])(\s|$)')
+
+def iter_markdown_blocks(lines, max_chunk=STREAM_CHUNK_SIZE):
+    """Group source lines into chunks that can be converted independently
+    
+    Once max_chunk characters are buffered, a chunk ends at the next blank
+    line outside fenced code that is followed by a heading or by an
+    unindented line that does not continue a list, quote or table.
+    Reference links and footnotes only resolve within their own chunk.
+    """
+    
+    buffer = []
+    size = 0
+    in_fence = False
+    after_blank = False
+    
+    for line in lines:
+        stripped = line.lstrip()
+        if size >= max_chunk and after_blank and not in_fence and stripped:
+            if line.startswith('#') or (not line[0].isspace()
+                                        and not _CONTINUATION_RE.match(stripped)):
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+        
+        if stripped.startswith(('```', '~~~')):
+            in_fence = not in_fence
+        buffer.append(line)
+        size += len(line)
+        after_blank = not stripped
+    
+    if buffer:
+        yield ''.join(buffer)
+
+def convert_markdown_stream(lines, max_chunk=STREAM_CHUNK_SIZE):
+    """Convert markdown lines chunk by chunk, yielding HTML fragments"""
+    for chunk in iter_markdown_blocks(lines, max_chunk):
+        yield convert_markdown(chunk)
@@ -0,0 +1,87 @@
+"""
+VoidSEO Template Minify
+Whitespace and comment stripping for the generated pages and stylesheets
+"""
+
+import re
+
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.S)
+_CSS_STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+_CSS_SPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*|\s*(:)\s*(?![^{}]*\{)')
+
+# Elements whose content is kept byte for byte (style content is minified as CSS)
+_HTML_RAW_RE = re.compile(r'(<(pre|code|textarea|script|style)\b[^>]*>)(.*?)(</\2\s*>)', re.S | re.I)
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[if|<!|>).*?-->', re.S)
+_HTML_SPACE_RE = re.compile(r'[ \t\r\n\f]+')
+_HTML_PLACEHOLDER_RE = re.compile(r'\x00(\d+)\x00')
+
+# Whitespace next to these tags never renders, so it can be dropped entirely
+_BLOCK_TAGS = ('!doctype|address|article|aside|blockquote|body|br|dd|div|dl|dt|fieldset|figcaption|figure|'
+               'footer|form|h[1-6]|head|header|hr|html|li|link|main|meta|nav|noscript|ol|option|p|pre|'
+               'script|section|select|style|table|tbody|td|tfoot|th|thead|title|tr|ul')
+_HTML_BLOCK_SPACE_RE = re.compile(rf' ?(</?(?:{_BLOCK_TAGS})\b[^>]*>) ?', re.I)
+
+def minify_css(css):
+    """Strip comments and redundant whitespace from a stylesheet, leaving strings intact"""
+
+    # Set strings aside so `content: "✏️ FILL THIS SECTION"` keeps its spaces
+    strings = []
+
+    def stash(match):
+        strings.append(match.group(0))
+        return f'"\0{len(strings) - 1}\0"'
+
+    css = _CSS_STRING_RE.sub(stash, _CSS_COMMENT_RE.sub('', css))
+    css = _CSS_SPACE_RE.sub(' ', css)
+    css = _CSS_PUNCTUATION_RE.sub(lambda m: m.group(1) or m.group(2), css)
+    css = css.replace(';}', '}').strip()
+    return re.sub(r'"\0(\d+)\0"', lambda m: strings[int(m.group(1))], css)
+
+def minify_html(html):
+    """Collapse whitespace and drop comments from a page
+
+    Content of <pre>, <code>, <textarea> and <script> is left untouched and
+    <style> content is minified as CSS. Whitespace between inline elements
+    is collapsed to one space rather than removed.
+    """
+
+    raw = []
+
+    def stash(match):
+        opening, tag, content, closing = match.groups()
+        if tag.lower() == 'style':
+            content = minify_css(content)
+        raw.append(content)
+        return f'{opening}\x00{len(raw) - 1}\x00{closing}'
+
+    html = _HTML_RAW_RE.sub(stash, html)
+    html = _HTML_COMMENT_RE.sub('', html)
+    html = _HTML_SPACE_RE.sub(' ', html)
+    html = _HTML_BLOCK_SPACE_RE.sub(r'\1', html).strip()
+    return _HTML_PLACEHOLDER_RE.sub(lambda m: raw[int(m.group(1))], html)
+
+def split_css_rules(css):
+    """Split a stylesheet into (prelude, rule text) pairs for each top-level rule
+
+    The prelude is the selector list or at-rule with whitespace collapsed, so
+    nested blocks such as @media stay whole.
+    """
+
+    rules = []
+    css = _CSS_COMMENT_RE.sub('', css)
+    depth = 0
+    start = 0
+    prelude_end = None
+    for index, char in enumerate(css):
+        if char == '{':
+            if depth == 0:
+                prelude_end = index
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                prelude = _CSS_SPACE_RE.sub(' ', css[start:prelude_end]).strip()
+                rules.append((prelude, css[start:index + 1].strip()))
+                start = index + 1
+    return rules
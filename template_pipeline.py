@@ -0,0 +1,124 @@
+"""
+VoidSEO Template Pipeline
+asyncio pipeline that overlaps source reads and output writes with conversion
+
+Reads and writes run in threads, conversion runs in an executor, and the
+stages are linked by bounded queues so a slow stage holds the others back
+instead of letting work pile up in memory.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import build_trace
+
+IO_WORKERS = 4
+QUEUE_SIZE = 8
+
+_DONE = object()
+
+def _read_source(path):
+    """Read a template source as text"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+def _write_output(path, payload):
+    """Atomically write text or bytes to path"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    if isinstance(payload, bytes):
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+    else:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(payload)
+    os.replace(tmp_path, path)
+
+def _timed(function, *args):
+    """Call function in this thread, returning (wall-clock start ns, duration ns, thread id, result)"""
+    timestamp = time.time_ns()
+    started = time.perf_counter_ns()
+    result = function(*args)
+    return timestamp, time.perf_counter_ns() - started, threading.get_ident(), result
+
+async def _run(tasks, convert, executor, converters, io_workers, queue_size):
+    """Run the read, convert and write stages and return {output_path: error or None}"""
+
+    loop = asyncio.get_running_loop()
+    trace = build_trace.active()
+    pending = iter(tasks)
+    converting = asyncio.Queue(maxsize=queue_size)
+    writing = asyncio.Queue(maxsize=queue_size)
+    results = {}
+
+    def fail(output_path, error):
+        results[output_path] = error
+        print(f"❌ Error generating {output_path}: {error}")
+
+    async def read():
+        for source_path, output_path in pending:
+            try:
+                timestamp, duration, tid, text = await asyncio.to_thread(_timed, _read_source, source_path)
+            except (OSError, UnicodeDecodeError) as e:
+                fail(output_path, e)
+                continue
+            # Reads and writes interleave on this thread, so they are timed
+            # per item instead of through build_trace.stage()
+            build_trace.record('read', Path(source_path).stem, timestamp, duration, tid)
+            await converting.put((source_path, output_path, text))
+
+    async def convert_sources():
+        while (item := await converting.get()) is not _DONE:
+            source_path, output_path, text = item
+            try:
+                error, payload, events = await loop.run_in_executor(executor, convert, source_path, text)
+            except Exception as e:
+                error, payload, events = f"worker failed: {e}", None, []
+            if trace is not None:
+                trace.merge(events)
+            if error is not None:
+                fail(output_path, error)
+                continue
+            await writing.put((output_path, payload))
+
+    async def write():
+        while (item := await writing.get()) is not _DONE:
+            output_path, payload = item
+            try:
+                timestamp, duration, tid, _ = await asyncio.to_thread(_timed, _write_output, output_path, payload)
+            except OSError as e:
+                fail(output_path, e)
+                continue
+            build_trace.record('write', Path(output_path).stem, timestamp, duration, tid)
+            results[output_path] = None
+            print(f"✅ Generated: {output_path}")
+
+    # Each stage tells the next one to stop once all of its workers are done
+    readers = [asyncio.create_task(read()) for _ in range(io_workers)]
+    converter_tasks = [asyncio.create_task(convert_sources()) for _ in range(converters)]
+    writers = [asyncio.create_task(write()) for _ in range(io_workers)]
+
+    await asyncio.gather(*readers)
+    for _ in converter_tasks:
+        await converting.put(_DONE)
+    await asyncio.gather(*converter_tasks)
+    for _ in writers:
+        await writing.put(_DONE)
+    await asyncio.gather(*writers)
+    return results
+
+def run_pipeline(tasks, convert, executor, converters=1, io_workers=IO_WORKERS, queue_size=QUEUE_SIZE):
+    """Build every (source_path, output_path) task through the pipeline
+
+    convert(source_path, text) runs in executor and must return
+    (error or None, text or bytes to write, trace events). A failure only
+    affects its own file. Yields (output_path, success) in task order.
+    """
+
+    tasks = list(tasks)
+    results = asyncio.run(_run(tasks, convert, executor, converters, io_workers, queue_size))
+    for _, output_path in tasks:
+        yield output_path, results.get(output_path, "not built") is None
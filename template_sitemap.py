@@ -0,0 +1,253 @@
+"""
+VoidSEO Template Sitemap
+Merges generated pages into sitemap.xml, splitting into a sitemap index
+once the protocol's URL limit is reached
+"""
+
+import filecmp
+import json
+import os
+import time
+import xml.etree.ElementTree as etree
+from collections import namedtuple
+from html import escape
+from pathlib import Path
+
+from build_manifest import file_digest
+
+SITE_URL = "https://voidseo.dev"
+SITEMAP_NAME = "sitemap.xml"
+# Source digest and lastmod of every generated page; committed with
+# sitemap.xml so fresh checkouts and CI runs can tell when content changed
+STATE_NAME = ".sitemap-state.json"
+STATE_VERSION = 1
+
+# sitemaps.org protocol limit per sitemap file
+MAX_URLS = 50000
+
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+_URL_TAG = f"{{{SITEMAP_NS}}}url"
+_SITEMAP_TAG = f"{{{SITEMAP_NS}}}sitemap"
+_INDEX_TAG = f"{{{SITEMAP_NS}}}sitemapindex"
+_FIELDS = ('loc', 'lastmod', 'changefreq', 'priority')
+
+SitemapEntry = namedtuple('SitemapEntry', _FIELDS, defaults=(None, None, None))
+
+# A generated page: URL path relative to the site root and the source it is built from
+SitemapPage = namedtuple('SitemapPage', ['path', 'source', 'changefreq', 'priority'],
+                         defaults=('monthly', '0.6'))
+
+def _child_text(element, name):
+    """Return the stripped text of a namespaced child, or None"""
+    child = element.find(f"{{{SITEMAP_NS}}}{name}")
+    return child.text.strip() if child is not None and child.text else None
+
+def iter_sitemap_entries(sitemap_path):
+    """Stream the URL entries of a sitemap, following a sitemap index to its local files"""
+
+    sitemap_path = Path(sitemap_path)
+    if not sitemap_path.exists():
+        return
+    context = etree.iterparse(sitemap_path, events=('start', 'end'))
+    _, root = next(context)
+    for event, element in context:
+        if event != 'end':
+            continue
+        if element.tag == _URL_TAG:
+            yield SitemapEntry(*(_child_text(element, name) for name in _FIELDS))
+            root.clear()
+        elif element.tag == _SITEMAP_TAG and root.tag == _INDEX_TAG:
+            loc = _child_text(element, 'loc')
+            root.clear()
+            if loc:
+                yield from iter_sitemap_entries(sitemap_path.with_name(loc.rsplit('/', 1)[-1]))
+
+class SitemapWriter:
+    """Write entries into sitemap files of at most max_urls URLs each
+
+    Everything is written to temporary files; close() moves them into place,
+    adding a sitemap index when more than one file was needed, and leaves
+    files whose content did not change untouched.
+    """
+
+    def __init__(self, sitemap_path, site_url=SITE_URL, max_urls=MAX_URLS):
+        self.sitemap_path = Path(sitemap_path)
+        self.site_url = site_url.rstrip('/')
+        self.max_urls = max_urls
+        self.parts = []
+        self.file = None
+        self.count = 0
+
+    def part_path(self, number):
+        """Return the path of the numbered sitemap used once the index is needed"""
+        return self.sitemap_path.with_name(f"{self.sitemap_path.stem}-{number}{self.sitemap_path.suffix}")
+
+    def _start_part(self):
+        path = self.part_path(len(self.parts) + 1)
+        self.parts.append(path)
+        self.file = open(path.with_name(path.name + '.tmp'), 'w', encoding='utf-8')
+        self.file.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n')
+
+    def _finish_part(self):
+        self.file.write('</urlset>\n')
+        self.file.close()
+        self.file = None
+
+    def add(self, entry):
+        """Append one URL entry"""
+        if self.file is None or self.count == self.max_urls:
+            if self.file is not None:
+                self._finish_part()
+            self._start_part()
+            self.count = 0
+        lines = ['    <url>']
+        for name in _FIELDS:
+            value = getattr(entry, name)
+            if value:
+                lines.append(f'        <{name}>{escape(value, quote=False)}</{name}>')
+        lines.append('    </url>\n')
+        self.file.write('\n'.join(lines))
+        self.count += 1
+
+    def abort(self):
+        """Discard everything written so far"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        for path in self.parts:
+            tmp_path = path.with_name(path.name + '.tmp')
+            if tmp_path.exists():
+                os.remove(tmp_path)
+
+    def close(self):
+        """Move the finished files into place and return the paths that changed"""
+        if self.file is None:
+            self._start_part()
+        self._finish_part()
+
+        written = []
+        if len(self.parts) == 1:
+            # A single sitemap keeps the plain name
+            targets = [(self.parts[0].with_name(self.parts[0].name + '.tmp'), self.sitemap_path)]
+        else:
+            targets = [(path.with_name(path.name + '.tmp'), path) for path in self.parts]
+            index_tmp = self.sitemap_path.with_name(self.sitemap_path.name + '.tmp')
+            with open(index_tmp, 'w', encoding='utf-8') as f:
+                f.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n')
+                for path in self.parts:
+                    loc = escape(f"{self.site_url}/{path.name}", quote=False)
+                    f.write(f'    <sitemap>\n        <loc>{loc}</loc>\n    </sitemap>\n')
+                f.write('</sitemapindex>\n')
+            targets.append((index_tmp, self.sitemap_path))
+
+        for tmp_path, path in targets:
+            if path.exists() and filecmp.cmp(tmp_path, path, shallow=False):
+                os.remove(tmp_path)
+            else:
+                os.replace(tmp_path, path)
+                written.append(path)
+
+        # Drop numbered sitemaps left over from a larger earlier run
+        keep = len(self.parts) if len(self.parts) > 1 else 0
+        number = keep + 1
+        while self.part_path(number).exists():
+            os.remove(self.part_path(number))
+            number += 1
+        return written
+
+def _load_state(path):
+    """Load {loc: {'digest', 'lastmod'}} for previously generated pages"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data.get('entries', {}) if data.get('version') == STATE_VERSION else {}
+
+def _save_state(path, entries):
+    """Atomically write the generated-page state"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'version': STATE_VERSION, 'entries': entries}, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def _mtime_date(path):
+    """Return a file's modification date as a W3C date"""
+    return time.strftime('%Y-%m-%d', time.gmtime(os.stat(path).st_mtime))
+
+def update_sitemap(sitemap_path, pages, site_url=SITE_URL, max_urls=MAX_URLS):
+    """Merge generated pages into the sitemap, streaming existing entries through
+
+    A page's lastmod only moves when its source content changes; hand-written
+    entries are kept as they are, and generated pages that are no longer
+    built are dropped. Returns the paths that were rewritten.
+    """
+
+    sitemap_path = Path(sitemap_path)
+    state_path = sitemap_path.with_name(STATE_NAME)
+    state = _load_state(state_path)
+    site_url = site_url.rstrip('/')
+
+    # lastmod None means "keep the sitemap's date, else use the source's mtime"
+    generated = {}
+    new_state = {}
+    for page in pages:
+        loc = f"{site_url}/{page.path.lstrip('/')}"
+        digest = file_digest(page.source)
+        previous = state.get(loc)
+        if previous is None:
+            lastmod = None
+        elif previous['digest'] == digest:
+            lastmod = previous['lastmod']
+        else:
+            lastmod = _mtime_date(page.source)
+        generated[loc] = (page, lastmod)
+        new_state[loc] = {'digest': digest, 'lastmod': lastmod}
+
+    def resolve(loc, existing=None):
+        page, lastmod = generated.pop(loc)
+        lastmod = lastmod or (existing.lastmod if existing is not None else None) or _mtime_date(page.source)
+        new_state[loc]['lastmod'] = lastmod
+        return SitemapEntry(loc, lastmod, page.changefreq, page.priority)
+
+    writer = SitemapWriter(sitemap_path, site_url, max_urls)
+    try:
+        for entry in iter_sitemap_entries(sitemap_path):
+            if entry.loc in generated:
+                writer.add(resolve(entry.loc, entry))
+            elif entry.loc not in state and entry.loc not in new_state:
+                writer.add(entry)
+        for loc in list(generated):
+            writer.add(resolve(loc))
+    except BaseException:
+        writer.abort()
+        raise
+    written = writer.close()
+
+    _save_state(state_path, new_state)
+    return written
+
+def template_pages(base_dir, sources, html_dir):
+    """Return a SitemapPage for every template whose HTML page exists"""
+    pages = []
+    for source in sources:
+        html_path = Path(html_dir) / f"{source.path.stem}.html"
+        if html_path.exists():
+            url_path = Path(os.path.relpath(html_path, base_dir)).as_posix()
+            pages.append(SitemapPage(url_path, source.path))
+    return pages
+
+def update_template_sitemap(base_dir, sources, html_dir):
+    """Merge the generated template pages into the site's sitemap and report it"""
+    sitemap_path = Path(base_dir) / SITEMAP_NAME
+    try:
+        written = update_sitemap(sitemap_path, template_pages(base_dir, sources, html_dir))
+    except (OSError, etree.ParseError) as e:
+        print(f"❌ Error updating {sitemap_path}: {e}")
+        return False
+    if written:
+        for path in written:
+            print(f"🗺️  Updated sitemap: {path}")
+    else:
+        print(f"⏭️  Up to date: {sitemap_path}")
+    return True
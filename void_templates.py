@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+VoidSEO Templates CLI
+One entry point for the template tools; each command imports only the modules it needs
+
+Usage:
+    python void_templates.py html [--minify ...]   # same options as create_html_templates.py
+    python void_templates.py pdf [--jobs N ...]    # same options as generate_pdf_templates.py
+    python void_templates.py all [--watch ...]     # same options as build_templates.py
+    python void_templates.py check                 # exit 1 if any generated output is stale
+    python void_templates.py index                 # rewrite the HTML and PDF index pages
+"""
+
+import argparse
+import importlib
+import os
+import sys
+from pathlib import Path
+
+# Commands handed to another script's main(), which parses the remaining arguments
+DELEGATED_COMMANDS = {
+    'html': ('create_html_templates', "generate the HTML templates"),
+    'pdf': ('generate_pdf_templates', "generate the PDF templates"),
+    'all': ('build_templates', "build HTML and PDF from one conversion per template"),
+    'personalize': ('personalize_templates', "build pre-filled template copies from CSV or JSONL records"),
+    'minify': ('minify_site', "minify the static site pages"),
+    'audit': ('seo_audit', "audit links and meta tags of the site pages"),
+    'serve': ('render_server', "serve personalized pages and PDFs from a warm local render service"),
+}
+
+def output_dirs(base_dir, args):
+    """Return (html_dir, pdf_dir), None for a format excluded by --html-only or --pdf-only"""
+    html_dir = None if args.pdf_only else base_dir / "templates" / "html"
+    pdf_dir = None if args.html_only else base_dir / "templates" / "pdf"
+    return html_dir, pdf_dir
+
+def stale_outputs(base_dir, html_dir=None, pdf_dir=None, minify=False, optimize=False, external_css=False):
+    """Return the outputs a build with these options would not reproduce
+
+    Sources and generator code are hashed against the build manifests. An
+    HTML page the manifest cannot vouch for, as in a fresh clone where the
+    manifest is not committed, is rendered and compared with the page on
+    disk; a match is recorded in the manifest, so later checks and builds
+    skip it. PDFs are checked against the manifest only, so WeasyPrint is
+    never imported.
+    """
+
+    from build_manifest import BuildManifest, file_digest
+    from template_index import discover_templates
+    import create_html_templates as html_templates
+    import generate_pdf_templates as pdf_templates
+
+    html_manifest = BuildManifest(html_dir) if html_dir else None
+    pdf_manifest = BuildManifest(pdf_dir) if pdf_dir else None
+    # The <head> markup an --external-css build uses; the stylesheet itself is not written
+    style = html_templates.external_style() if external_css and html_dir else None
+
+    stale = []
+    for source in discover_templates(base_dir):
+        source_hash = file_digest(source.path)
+        if html_manifest:
+            output_path = html_dir / f"{source.path.stem}.html"
+            fingerprint = html_templates.output_fingerprint(source_hash, style=style, minify=minify)
+            if not html_manifest.is_fresh(output_path, fingerprint):
+                if page_matches(source.path, output_path, style=style, minify=minify):
+                    html_manifest.record(output_path, fingerprint)
+                else:
+                    stale.append(output_path)
+        if pdf_manifest:
+            output_path = pdf_dir / f"{source.path.stem}.pdf"
+            fingerprint = pdf_templates.output_fingerprint(source_hash, optimize)
+            if not pdf_manifest.is_fresh(output_path, fingerprint):
+                stale.append(output_path)
+    if html_manifest:
+        html_manifest.save()
+    return stale
+
+def page_matches(source_path, output_path, style=None, minify=False):
+    """Check whether output_path holds exactly the page a build would render from source_path"""
+
+    import create_html_templates as html_templates
+
+    try:
+        with open(output_path, 'r', encoding='utf-8', newline='') as f:
+            current = f.read()
+        with open(source_path, 'r', encoding='utf-8') as f:
+            md_text = f.read()
+    except (OSError, UnicodeDecodeError):
+        return False
+    return html_templates.render_html_page(source_path, md_text, style=style, minify=minify) == current
+
+def check(args):
+    """Report stale outputs; exit status 1 if there are any"""
+
+    base_dir = Path(__file__).parent
+    html_dir, pdf_dir = output_dirs(base_dir, args)
+    stale = stale_outputs(base_dir, html_dir, pdf_dir, minify=args.minify, optimize=args.optimize,
+                          external_css=args.external_css)
+
+    for output_path in stale:
+        print(f"⚠️  Stale: {os.path.relpath(output_path, base_dir)}")
+    if stale:
+        print(f"❌ {len(stale)} outputs need rebuilding")
+        return 1
+    print("✅ All outputs up to date")
+    return 0
+
+def index(args):
+    """Rewrite the HTML and PDF index pages"""
+
+    from template_compress import remove_stale_compressed
+
+    base_dir = Path(__file__).parent
+    html_dir, pdf_dir = output_dirs(base_dir, args)
+
+    if html_dir:
+        import create_html_templates as html_templates
+        html_dir.mkdir(parents=True, exist_ok=True)
+        style = html_templates.write_external_stylesheet(html_dir) if args.external_css else None
+        html_templates.create_html_index(html_dir, style, minify=args.minify)
+        remove_stale_compressed([html_dir / "index.html"])
+    if pdf_dir:
+        import generate_pdf_templates as pdf_templates
+        pdf_dir.mkdir(parents=True, exist_ok=True)
+        pdf_templates.create_pdf_index(pdf_dir, minify=args.minify)
+        remove_stale_compressed([pdf_dir / "index.html"])
+    return 0
+
+def add_format_options(parser):
+    """Add the --html-only / --pdf-only switches"""
+    formats = parser.add_mutually_exclusive_group()
+    formats.add_argument('--html-only', action='store_true', help="only the HTML pages")
+    formats.add_argument('--pdf-only', action='store_true', help="only the PDFs")
+
+def main(argv=None):
+    """Main function to dispatch a template command"""
+
+    parser = argparse.ArgumentParser(description="VoidSEO template tools")
+    commands = parser.add_subparsers(dest='command', required=True, metavar='COMMAND')
+    for name, (_, help_text) in DELEGATED_COMMANDS.items():
+        # The command's own script parses everything after its name, --help included
+        commands.add_parser(name, help=help_text, add_help=False)
+
+    check_parser = commands.add_parser('check', help="exit 1 if any generated output is stale")
+    check_parser.add_argument('--minify', action='store_true', help="check against minified HTML builds")
+    check_parser.add_argument('--optimize', action='store_true', help="check against --optimize PDF builds")
+    check_parser.add_argument('--external-css', action='store_true', help="check against --external-css HTML builds")
+    add_format_options(check_parser)
+    check_parser.set_defaults(handler=check)
+
+    index_parser = commands.add_parser('index', help="rewrite the HTML and PDF index pages")
+    index_parser.add_argument('--external-css', action='store_true',
+                              help="link the shared, content-hashed stylesheet")
+    index_parser.add_argument('--minify', action='store_true', help="strip whitespace from the index pages")
+    add_format_options(index_parser)
+    index_parser.set_defaults(handler=index)
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+    args, remaining = parser.parse_known_args(argv)
+
+    if args.command in DELEGATED_COMMANDS:
+        module = importlib.import_module(DELEGATED_COMMANDS[args.command][0])
+        # Usage lines read "void_templates.py html ..." rather than the script name
+        sys.argv[0] = f"{parser.prog} {args.command}"
+        return module.main(argv[argv.index(args.command) + 1:])
+
+    if remaining:
+        parser.error(f"unrecognized arguments: {' '.join(remaining)}")
+    return args.handler(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+VoidSEO Worker Pool
+Process pool that recycles its workers to keep long runs' memory bounded
+
+Each worker is replaced after a number of tasks, or once its resident set
+grows past a share of the RSS ceiling. A worker that crosses the ceiling
+mid-task is killed; its task is retried once in a fresh worker and then
+reported as failed, so one oversized document cannot push the box into OOM.
+"""
+
+import multiprocessing
+import os
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing.connection import wait
+
+# Seconds between RSS checks of busy workers
+RSS_POLL_INTERVAL = 0.2
+
+# A worker whose RSS after a task exceeds this share of the ceiling is
+# replaced, so the next document starts from a fresh baseline
+RECYCLE_RSS_FRACTION = 0.75
+
+# Fresh-worker attempts after a task pushed its worker past a limit
+TASK_RETRIES = 1
+
+try:
+    _PAGE_SIZE = os.sysconf('SC_PAGE_SIZE')
+except (AttributeError, ValueError, OSError):
+    _PAGE_SIZE = 4096
+
+class WorkerLimitError(RuntimeError):
+    """A task lost its worker on every attempt"""
+
+def process_rss(pid):
+    """Return a process's resident set size in bytes, or None where /proc is unavailable"""
+    try:
+        with open(f'/proc/{pid}/statm', 'rb') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE
+    except (OSError, ValueError, IndexError):
+        return None
+
+def _worker_main(conn, initializer, initargs):
+    """Worker process loop: run (fn, args) messages until None arrives"""
+    if initializer is not None:
+        initializer(*initargs)
+    while True:
+        try:
+            message = conn.recv()
+        except EOFError:
+            return
+        if message is None:
+            return
+        fn, args = message
+        try:
+            reply = (True, fn(*args))
+        except BaseException as e:
+            reply = (False, e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # The result or exception could not be pickled
+            conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+class _Task:
+    def __init__(self, future, fn, args):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.attempts = 0
+
+class _Worker:
+    def __init__(self, context, initializer, initargs):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, initializer, initargs), daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.task = None
+        self.completed = 0
+
+    def stop(self, kill=False):
+        """Ask the worker to exit (or kill it) and reap the process"""
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+        self.process.join()
+        self.conn.close()
+
+class RecyclingPool(Executor):
+    """Executor running tasks in worker processes that are recycled by task count and RSS
+
+    max_tasks: replace a worker after this many tasks (None: never)
+    max_rss: RSS ceiling in bytes per worker (None: no ceiling)
+
+    Workers are started with the forkserver or spawn method, since the pool
+    starts replacements from its manager thread.
+    """
+
+    def __init__(self, max_workers, initializer=None, initargs=(), max_tasks=None, max_rss=None):
+        methods = multiprocessing.get_all_start_methods()
+        self._context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+        self._max_workers = max(1, max_workers)
+        self._initializer = initializer
+        self._initargs = initargs
+        self.max_tasks = max_tasks or None
+        self.max_rss = max_rss or None
+        self._pending = deque()
+        self._lock = threading.Lock()
+        self._wake_reader, self._wake_writer = self._context.Pipe(duplex=False)
+        self._shutdown = False
+        self._thread = None
+
+        # Counters and retry reasons, read by callers for their reports
+        self.recycled = 0
+        self.retries = {}
+
+    def submit(self, fn, /, *args, **kwargs):
+        if kwargs:
+            raise TypeError("RecyclingPool.submit() takes positional arguments only")
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._pending.append(_Task(future, fn, args))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._manage, name='recycling-pool', daemon=True)
+                self._thread.start()
+            self._wake_writer.send(None)
+        return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            if cancel_futures:
+                while self._pending:
+                    self._pending.popleft().future.cancel()
+            self._shutdown = True
+            thread = self._thread
+            if thread is not None:
+                self._wake_writer.send(None)
+        if wait and thread is not None:
+            thread.join()
+
+    def _next_task(self):
+        """Pop the next task that has not been cancelled, or None"""
+        with self._lock:
+            while self._pending:
+                task = self._pending.popleft()
+                if task.attempts or task.future.set_running_or_notify_cancel():
+                    return task
+        return None
+
+    def _fail(self, worker, reason, workers):
+        """Handle a worker lost mid-task: retry its task once in a fresh worker, then report it"""
+        task = worker.task
+        workers.remove(worker)
+        self.recycled += 1
+        task.attempts += 1
+        if task.attempts <= TASK_RETRIES:
+            self.retries[task.future] = reason
+            with self._lock:
+                self._pending.appendleft(task)
+        else:
+            task.future.set_exception(WorkerLimitError(f"{reason} (also in a fresh worker)"))
+
+    def _manage(self):
+        """Manager thread: hand out tasks, collect results and recycle workers"""
+        workers = []
+        try:
+            while True:
+                # Give every idle worker, or a new one, the next task
+                for worker in [worker for worker in workers if worker.task is None] + [None] * (
+                        self._max_workers - len(workers)):
+                    task = self._next_task()
+                    if task is None:
+                        break
+                    if worker is None:
+                        worker = _Worker(self._context, self._initializer, self._initargs)
+                        workers.append(worker)
+                    worker.task = task
+                    worker.conn.send((task.fn, task.args))
+
+                busy = [worker for worker in workers if worker.task is not None]
+                with self._lock:
+                    if self._shutdown and not busy and not self._pending:
+                        break
+                timeout = RSS_POLL_INTERVAL if busy and self.max_rss else None
+                ready = wait([self._wake_reader] + [worker.conn for worker in busy], timeout)
+
+                if self._wake_reader in ready:
+                    while self._wake_reader.poll():
+                        self._wake_reader.recv()
+
+                for worker in busy:
+                    if worker.conn in ready:
+                        try:
+                            ok, payload = worker.conn.recv()
+                        except (EOFError, OSError):
+                            worker.stop(kill=True)
+                            self._fail(worker, f"worker exited with code {worker.process.exitcode}", workers)
+                            continue
+                        task, worker.task = worker.task, None
+                        if ok:
+                            task.future.set_result(payload)
+                        else:
+                            task.future.set_exception(payload)
+                        worker.completed += 1
+                        rss = process_rss(worker.process.pid) if self.max_rss else None
+                        if (self.max_tasks and worker.completed >= self.max_tasks) or (
+                                rss is not None and rss > self.max_rss * RECYCLE_RSS_FRACTION):
+                            worker.stop()
+                            workers.remove(worker)
+                            self.recycled += 1
+                    elif self.max_rss:
+                        rss = process_rss(worker.process.pid)
+                        if rss is not None and rss > self.max_rss:
+                            worker.stop(kill=True)
+                            self._fail(worker, f"exceeded the {self.max_rss // (1024 * 1024)} MB RSS ceiling",
+                                       workers)
+        except BaseException as e:
+            # Never leave callers waiting on futures that cannot complete
+            for worker in workers:
+                if worker.task is not None and not worker.task.future.done():
+                    worker.task.future.set_exception(e)
+            with self._lock:
+                while self._pending:
+                    task = self._pending.popleft()
+                    if task.attempts or task.future.set_running_or_notify_cancel():
+                        task.future.set_exception(e)
+            raise
+        finally:
+            for worker in workers:
+                worker.stop(kill=worker.task is not None)